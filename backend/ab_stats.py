@@ -0,0 +1,393 @@
+# ================================================================
+# TRUST ENGINE - VECTORIZED A/B TEST STATISTICS
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Pure NumPy/SciPy helpers shared by the A/B testing endpoints. Every
+# function works on 2-D arrays shaped (n_tests, n_arms) so hundreds of
+# experiments with ragged arm counts are evaluated in one call. Arm 0 of
+# each test is the control; padding arms carry zero users and come back
+# as NaN.
+# ================================================================
+
+import numpy as np
+from scipy import special, stats
+
+# Multiple-comparison corrections accepted by adjust_pvalues
+CORRECTION_METHODS = ('holm', 'bonferroni', 'fdr_bh', 'none')
+
+# ================================================================
+# INPUT SHAPING
+# ================================================================
+
+def pad_arms(users_per_test, conversions_per_test):
+    """Pack ragged per-test arm lists into (n_tests, max_arms) float arrays.
+
+    Returns (users, conversions, arm_counts). Raises ValueError on
+    malformed input so endpoints can answer with a 400.
+    """
+    if len(users_per_test) != len(conversions_per_test):
+        raise ValueError('users and conversions must describe the same number of tests')
+    if not users_per_test:
+        raise ValueError('at least one test is required')
+
+    arm_counts = np.array([len(arms) for arms in users_per_test], dtype=np.int64)
+    if any(len(u) != len(c) for u, c in zip(users_per_test, conversions_per_test)):
+        raise ValueError('each test needs one conversion count per arm')
+    if arm_counts.min() < 2:
+        raise ValueError('each test needs a control and at least one variant')
+
+    n_tests, max_arms = len(users_per_test), int(arm_counts.max())
+    users = np.zeros((n_tests, max_arms))
+    conversions = np.zeros((n_tests, max_arms))
+
+    flat_users = np.concatenate([np.asarray(u, dtype=float) for u in users_per_test])
+    flat_conversions = np.concatenate([np.asarray(c, dtype=float) for c in conversions_per_test])
+    if np.any(flat_users <= 0):
+        raise ValueError('every arm needs at least one user')
+    if np.any(flat_conversions < 0) or np.any(flat_conversions > flat_users):
+        raise ValueError('conversions must be between 0 and users for every arm')
+
+    # Scatter the flattened arms into the padded grid in one assignment
+    rows = np.repeat(np.arange(n_tests), arm_counts)
+    cols = np.arange(arm_counts.sum()) - np.repeat(np.cumsum(arm_counts) - arm_counts, arm_counts)
+    users[rows, cols] = flat_users
+    conversions[rows, cols] = flat_conversions
+
+    return users, conversions, arm_counts
+
+# ================================================================
+# CORE STATISTICS
+# ================================================================
+
+def conversion_rates(users, conversions):
+    """Per-arm conversion rates; padding arms (zero users) are NaN"""
+    with np.errstate(divide='ignore', invalid='ignore'):
+        return np.where(users > 0, conversions / users, np.nan)
+
+def wald_interval(users, conversions, alpha=0.05):
+    """Per-arm rate with its Wald confidence interval: (rate, lower, upper)"""
+    rate = conversion_rates(users, conversions)
+    z_crit = stats.norm.ppf(1 - alpha / 2)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        margin = z_crit * np.sqrt(rate * (1 - rate) / users)
+    return rate, rate - margin, rate + margin
+
+def cohens_h(rate_variant, rate_control):
+    """Cohen's h effect size between two proportions"""
+    return 2 * (np.arcsin(np.sqrt(rate_variant)) - np.arcsin(np.sqrt(rate_control)))
+
+def adjust_pvalues(p_values, method='holm'):
+    """Family-wise/FDR correction along the last axis, ignoring NaN entries.
+
+    Each row is one family (the comparisons of a single test).
+    """
+    if method not in CORRECTION_METHODS:
+        raise ValueError(f"correction must be one of {', '.join(CORRECTION_METHODS)}")
+
+    p = np.asarray(p_values, dtype=float)
+    if method == 'none':
+        return p.copy()
+
+    missing = np.isnan(p)
+    m = (~missing).sum(axis=-1, keepdims=True)
+
+    if method == 'bonferroni':
+        return np.where(missing, np.nan, np.minimum(p * m, 1.0))
+
+    # Sort ascending per row (NaN last), adjust, then scatter back
+    order = np.argsort(p, axis=-1)
+    p_sorted = np.take_along_axis(p, order, axis=-1)
+    rank = np.arange(p.shape[-1])
+
+    if method == 'holm':
+        adjusted = np.fmax.accumulate((m - rank) * p_sorted, axis=-1)
+    else:  # fdr_bh
+        scaled = p_sorted * m / (rank + 1)
+        adjusted = np.flip(np.fmin.accumulate(np.flip(scaled, axis=-1), axis=-1), axis=-1)
+
+    result = np.empty_like(p)
+    np.put_along_axis(result, order, np.minimum(adjusted, 1.0), axis=-1)
+    return np.where(missing, np.nan, result)
+
+def compare_to_control(users, conversions, alpha=0.05, correction='holm'):
+    """Pairwise two-proportion z-tests of every variant arm against arm 0.
+
+    users and conversions are (n_tests, n_arms) arrays. All outputs are
+    arrays; per-comparison outputs are shaped (n_tests, n_arms - 1).
+    """
+    users = np.asarray(users, dtype=float)
+    conversions = np.asarray(conversions, dtype=float)
+
+    rate, rate_lower, rate_upper = wald_interval(users, conversions, alpha)
+
+    n_c, x_c, p_c = users[:, :1], conversions[:, :1], rate[:, :1]
+    n_v, x_v, p_v = users[:, 1:], conversions[:, 1:], rate[:, 1:]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        # Pooled standard error for the hypothesis test
+        pooled = (x_c + x_v) / (n_c + n_v)
+        se_pooled = np.sqrt(pooled * (1 - pooled) * (1 / n_c + 1 / n_v))
+        difference = p_v - p_c
+        z_scores = np.where(se_pooled > 0, difference / se_pooled, 0.0)
+        z_scores = np.where(np.isnan(p_v), np.nan, z_scores)
+        p_values = 2 * stats.norm.sf(np.abs(z_scores))
+
+        # Unpooled standard error for the interval on the difference
+        se_diff = np.sqrt(p_c * (1 - p_c) / n_c + p_v * (1 - p_v) / n_v)
+        z_crit = stats.norm.ppf(1 - alpha / 2)
+        relative_lift = np.where(p_c > 0, difference / p_c, np.nan)
+
+    p_adjusted = adjust_pvalues(p_values, correction)
+
+    return {
+        'rate': rate,
+        'rate_lower': rate_lower,
+        'rate_upper': rate_upper,
+        'difference': difference,
+        'difference_lower': difference - z_crit * se_diff,
+        'difference_upper': difference + z_crit * se_diff,
+        'relative_lift': relative_lift,
+        'z_score': z_scores,
+        'p_value': p_values,
+        'p_value_adjusted': p_adjusted,
+        'significant': p_adjusted < alpha,
+        'effect_size': cohens_h(p_v, p_c)
+    }
+
+# ================================================================
+# SEQUENTIAL TESTING (ALWAYS-VALID INFERENCE)
+# ================================================================
+
+def msprt(users, conversions, mixing_variance=1e-4, alpha=0.05):
+    """Mixture SPRT for each variant against arm 0 (normal approximation).
+
+    Uses a N(0, mixing_variance) prior on the rate difference, which gives
+    a closed-form likelihood ratio and an always-valid confidence
+    sequence. Inputs may be 1-D (one test) or (n_tests, n_arms). The
+    returned p-values are for the current look only - callers keep the
+    running minimum across looks to obtain the always-valid p-value.
+    """
+    users = np.atleast_2d(np.asarray(users, dtype=float))
+    conversions = np.atleast_2d(np.asarray(conversions, dtype=float))
+    tau2 = float(mixing_variance)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rate = np.clip(np.where(users > 0, conversions / users, np.nan), 0.0, 1.0)
+        p_c, p_v = rate[:, :1], rate[:, 1:]
+        difference = p_v - p_c
+        variance = p_c * (1 - p_c) / users[:, :1] + p_v * (1 - p_v) / users[:, 1:]
+        informative = np.isfinite(variance) & (variance > 0)
+        v = np.where(informative, variance, 1.0)
+
+        log_lr = 0.5 * np.log(v / (v + tau2)) + tau2 * difference ** 2 / (2 * v * (v + tau2))
+        log_lr = np.where(informative, log_lr, 0.0)
+        p_values = np.minimum(1.0, np.exp(-log_lr))
+
+        half_width = np.sqrt(v * (v + tau2) / tau2 * (np.log((v + tau2) / v) - 2 * np.log(alpha)))
+        half_width = np.where(informative, half_width, np.inf)
+
+    return {
+        'rate': rate,
+        'difference': difference,
+        'log_likelihood_ratio': log_lr,
+        'p_value': p_values,
+        'difference_lower': difference - half_width,
+        'difference_upper': difference + half_width
+    }
+
+# ================================================================
+# BAYESIAN ANALYSIS (BETA-BINOMIAL)
+# ================================================================
+
+def beta_posteriors(users, conversions, prior_alpha=1.0, prior_beta=1.0):
+    """Beta posterior parameters per arm under a Beta(prior_alpha, prior_beta) prior"""
+    users = np.asarray(users, dtype=float)
+    conversions = np.asarray(conversions, dtype=float)
+    return conversions + prior_alpha, users - conversions + prior_beta
+
+def _posterior_grids(post_alpha, post_beta, grid_size=1024):
+    """One grid per arm spanning that arm's own posterior (mean +/- 10 sd).
+
+    Returns (x, pdf) shaped (n_arms, grid_size), where pdf[i] is arm i's
+    density on its own grid x[i]. A single shared grid would leave narrow
+    posteriors between grid points whenever one arm sits far from the rest.
+    """
+    mean = post_alpha / (post_alpha + post_beta)
+    sd = np.sqrt(post_alpha * post_beta / ((post_alpha + post_beta) ** 2 * (post_alpha + post_beta + 1)))
+    lower = np.maximum(0.0, mean - 10 * sd)
+    upper = np.minimum(1.0, mean + 10 * sd)
+    x = np.linspace(lower, upper, grid_size, axis=1)
+
+    a, b = post_alpha[:, None], post_beta[:, None]
+    log_pdf = special.xlogy(a - 1, x) + special.xlog1py(b - 1, -x) - special.betaln(a, b)
+    return x, np.exp(log_pdf)
+
+def bayesian_compare(users, conversions, samples=0, seed=None, rng=None,
+                     prior_alpha=1.0, prior_beta=1.0, credible_level=0.95, grid_size=1024):
+    """Beta-Binomial comparison of every arm against arm 0 for one test.
+
+    By default every quantity is computed by 1-D quadrature over one arm's
+    posterior, with the other arms entering through their exact Beta cdf,
+    which is deterministic and takes a few milliseconds. With samples > 0,
+    every probability and expected loss is instead estimated from a single
+    (samples, n_arms) posterior draw matrix shared by all arms; pass seed
+    (or a numpy Generator) for reproducible draws.
+    """
+    post_alpha, post_beta = beta_posteriors(users, conversions, prior_alpha, prior_beta)
+    post_mean = post_alpha / (post_alpha + post_beta)
+    tail = (1 - credible_level) / 2
+
+    if samples:
+        rng = rng if rng is not None else np.random.default_rng(seed)
+        draws = rng.beta(post_alpha, post_beta, size=(int(samples), len(post_alpha)))
+        control, variants = draws[:, :1], draws[:, 1:]
+        beat_control = np.mean(variants > control, axis=0)
+        best = np.bincount(np.argmax(draws, axis=1), minlength=len(post_alpha)) / draws.shape[0]
+        loss_variant = np.mean(np.maximum(control - variants, 0.0), axis=0)
+        loss_control = np.mean(np.maximum(variants - control, 0.0), axis=0)
+    else:
+        x, pdf = _posterior_grids(post_alpha, post_beta, grid_size)
+        a, b = post_alpha[:, None, None], post_beta[:, None, None]
+        # cdf[j, i] = F_j on arm i's grid
+        cdf = special.betainc(a, b, x[None, :, :])
+
+        # Over the control's grid c: P(V > c), E[max(c - V, 0)] and E[max(V - c, 0)] are exact
+        # in the Beta cdf, using E[V; V <= c] = mean_V * I_c(alpha_V + 1, beta_V)
+        c, control_pdf = x[0], pdf[0]
+        variant_cdf = cdf[1:, 0]
+        variant_partial_mean = post_mean[1:, None] * special.betainc(post_alpha[1:, None] + 1, post_beta[1:, None], c)
+        beat_control = np.trapezoid(control_pdf * (1 - variant_cdf), c, axis=1)
+        loss_variant = np.trapezoid(control_pdf * (c * variant_cdf - variant_partial_mean), c, axis=1)
+        loss_control = np.trapezoid(
+            control_pdf * (post_mean[1:, None] - variant_partial_mean - c * (1 - variant_cdf)), c, axis=1
+        )
+
+        # P(arm i is best) = integral over arm i's grid of f_i * product of F_j for j != i
+        others = cdf.copy()
+        arms = np.arange(len(post_alpha))
+        others[arms, arms] = 1.0
+        best = np.trapezoid(pdf * np.prod(others, axis=0), x, axis=1)
+
+    return {
+        'posterior_alpha': post_alpha,
+        'posterior_beta': post_beta,
+        'posterior_mean': post_mean,
+        'credible_lower': special.betaincinv(post_alpha, post_beta, tail),
+        'credible_upper': special.betaincinv(post_alpha, post_beta, 1 - tail),
+        'probability_to_beat_control': np.clip(beat_control, 0.0, 1.0),
+        'probability_to_be_best': np.clip(best, 0.0, 1.0),
+        # Expected loss (in conversion-rate units) of shipping each option
+        'expected_loss_variant': np.maximum(loss_variant, 0.0),
+        'expected_loss_control': np.maximum(loss_control, 0.0)
+    }
+
+# ================================================================
+# POWER & SAMPLE-SIZE PLANNING
+# ================================================================
+
+def required_sample_size(baseline, relative_mde, alpha=0.05, power=0.8):
+    """Users per arm for a two-sided two-proportion z-test (vectorized closed form)"""
+    p1 = np.asarray(baseline, dtype=float)
+    p2 = p1 * (1 + np.asarray(relative_mde, dtype=float))
+    z_alpha = stats.norm.ppf(1 - alpha / 2)
+    z_beta = stats.norm.ppf(power)
+    p_bar = (p1 + p2) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        numerator = (z_alpha * np.sqrt(2 * p_bar * (1 - p_bar)) + z_beta * np.sqrt(p1 * (1 - p1) + p2 * (1 - p2))) ** 2
+        return numerator / (p2 - p1) ** 2
+
+def achieved_power(baseline, variant_rate, users_per_arm, alpha=0.05):
+    """Power of a two-sided two-proportion z-test for a true effect (vectorized)"""
+    p1 = np.asarray(baseline, dtype=float)
+    p2 = np.asarray(variant_rate, dtype=float)
+    n = np.asarray(users_per_arm, dtype=float)
+    z_alpha = stats.norm.ppf(1 - alpha / 2)
+    p_bar = (p1 + p2) / 2
+    with np.errstate(divide='ignore', invalid='ignore'):
+        se_null = np.sqrt(2 * p_bar * (1 - p_bar) / n)
+        se_alt = np.sqrt((p1 * (1 - p1) + p2 * (1 - p2)) / n)
+        power = stats.norm.sf((z_alpha * se_null - np.abs(p2 - p1)) / se_alt)
+    return np.where(se_alt > 0, power, np.nan)
+
+def minimum_detectable_effect(baseline, users_per_arm, alpha=0.05, power=0.8):
+    """Smallest relative lift detectable with users_per_arm (solved numerically)"""
+    from scipy.optimize import brentq
+    upper = 1 / baseline - 1 - 1e-9  # variant rate must stay below 1
+    gap = lambda mde: required_sample_size(baseline, mde, alpha, power) - users_per_arm
+    if gap(upper) > 0:
+        return float('nan')
+    return float(brentq(gap, 1e-6, upper))
+
+class PowerGrid:
+    """Precomputed sample-size surfaces for common (alpha, power) pairs.
+
+    For each pair, log(users per arm) is tabulated over log-spaced
+    baseline rates x relative MDEs, so planning queries are a bilinear
+    interpolation instead of a fresh solve. Alphas are tabulated as given
+    and Bonferroni-split for tests of up to max(ARM_COUNTS) arms, since the
+    planner divides alpha by the number of variants. Queries outside the
+    grid return None and callers fall back to the exact formulas.
+    """
+
+    ALPHAS = (0.01, 0.05, 0.10)
+    POWERS = (0.80, 0.90, 0.95)
+    ARM_COUNTS = (2, 3, 4, 5)
+
+    def __init__(self, baseline_range=(0.001, 0.5), mde_range=(0.005, 2.0), points=200):
+        self.log_baselines = np.linspace(np.log(baseline_range[0]), np.log(baseline_range[1]), points)
+        self.log_mdes = np.linspace(np.log(mde_range[0]), np.log(mde_range[1]), points)
+        baselines, mdes = np.exp(self.log_baselines)[:, None], np.exp(self.log_mdes)[None, :]
+
+        # Adjusted alphas are computed exactly as the planner does, so they match its keys
+        alphas = {self._round_alpha(alpha / (arms - 1)): alpha / (arms - 1) for alpha in self.ALPHAS for arms in self.ARM_COUNTS}
+        self.tables = {}
+        for key_alpha, alpha in alphas.items():
+            for power in self.POWERS:
+                with np.errstate(invalid='ignore'):
+                    n = required_sample_size(baselines, mdes, alpha, power)
+                # Lifts that push the variant rate past 100% are not plannable
+                self.tables[(key_alpha, power)] = np.where(baselines * (1 + mdes) < 1, np.log(n), np.nan)
+
+    @staticmethod
+    def _round_alpha(alpha):
+        # Fine enough that 0.0033 and 0.01 / 3 stay different keys
+        return round(alpha, 9)
+
+    def _key(self, alpha, power):
+        key = (self._round_alpha(alpha), round(power, 4))
+        return key if key in self.tables else None
+
+    def _baseline_row(self, table, baseline):
+        """Table row for baseline, linearly interpolated in log space"""
+        position = np.interp(np.log(baseline), self.log_baselines, np.arange(len(self.log_baselines)))
+        low = int(np.floor(position))
+        high = min(low + 1, len(self.log_baselines) - 1)
+        weight = position - low
+        return (1 - weight) * table[low] + weight * table[high]
+
+    def _in_range(self, log_baseline):
+        return self.log_baselines[0] <= log_baseline <= self.log_baselines[-1]
+
+    def sample_size(self, baseline, relative_mde, alpha=0.05, power=0.8):
+        """Interpolated users per arm, or None when outside the grid"""
+        key = self._key(alpha, power)
+        if key is None or not self._in_range(np.log(baseline)) \
+                or not self.log_mdes[0] <= np.log(relative_mde) <= self.log_mdes[-1]:
+            return None
+        row = self._baseline_row(self.tables[key], baseline)
+        value = np.interp(np.log(relative_mde), self.log_mdes, row)
+        return None if np.isnan(value) else float(np.exp(value))
+
+    def detectable_effect(self, baseline, users_per_arm, alpha=0.05, power=0.8):
+        """Interpolated relative MDE for users_per_arm, or None when outside the grid"""
+        key = self._key(alpha, power)
+        if key is None or not self._in_range(np.log(baseline)):
+            return None
+        row = self._baseline_row(self.tables[key], baseline)
+        valid = ~np.isnan(row)
+        # log(n) falls as the MDE grows, so reverse both axes for np.interp
+        log_n, log_mde = row[valid][::-1], self.log_mdes[valid][::-1]
+        if not log_n.size or not log_n[0] <= np.log(users_per_arm) <= log_n[-1]:
+            return None
+        return float(np.exp(np.interp(np.log(users_per_arm), log_n, log_mde)))
@@ -0,0 +1,244 @@
+# ================================================================
+# TRUST ENGINE - ASGI ENTRY POINT WITH NATIVE ASYNC AI ROUTES
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Serves the AI-bound endpoints (/api/bias-analysis, /api/explainable-ai,
+# /api/ab-test-analysis) as coroutines on one event loop: the keyword
+# scan and z-test still run synchronously, but the Gemini call is awaited,
+# so a single process can hold hundreds of in-flight AI requests without a
+# thread per request. Every other path (and CORS preflight) is handed to
+# the Flask app on a thread pool, unchanged.
+#
+# Run from the backend directory with:  uvicorn asgi:app
+# or under gunicorn with GUNICORN_ASGI=1 (see gunicorn.conf.py).
+# ================================================================
+
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+from asgiref.sync import sync_to_async
+from asgiref.wsgi import WsgiToAsgi, WsgiToAsgiInstance
+from flask_cors.core import try_match_any_pattern
+from pydantic import ValidationError
+from werkzeug.http import parse_accept_header
+
+from app import (
+    app as flask_app, logger, ai_client, CORS_ORIGINS, COMPRESSION_ENABLED, response_compressor,
+    BiasAnalysisRequest, ABTestRequest, AB_TEST_METHODS,
+    _detect_bias, _bias_ai_prompt, _bias_fallback_insights, _build_bias_results, _store_bias_analysis,
+    _explainable_ai_prompt, _explainable_ai_fallback, _explainable_ai_demo, _build_explainable_result,
+    _simulate_ab_test, _ab_test_ai_prompt, _generate_fallback_analysis, _build_ab_test_results
+)
+
+# Threads running delegated Flask requests (asgiref's default is a single shared thread)
+WSGI_BRIDGE_THREADS = int(os.getenv('WSGI_BRIDGE_THREADS', 16))
+
+wsgi_executor = ThreadPoolExecutor(max_workers=WSGI_BRIDGE_THREADS, thread_name_prefix='wsgi')
+
+class _ThreadedWsgiInstance(WsgiToAsgiInstance):
+    # Re-wrap the plain function behind asgiref's @sync_to_async with our own executor
+    run_wsgi_app = sync_to_async(
+        WsgiToAsgiInstance.__dict__['run_wsgi_app'].func, thread_sensitive=False, executor=wsgi_executor
+    )
+
+class ThreadedWsgiToAsgi(WsgiToAsgi):
+    """WsgiToAsgi that runs each WSGI request on the bridge pool instead of one shared thread"""
+
+    async def __call__(self, scope, receive, send):
+        await _ThreadedWsgiInstance(self.wsgi_application, self.duplicate_header_limit)(scope, receive, send)
+
+class JSONRequest:
+    """The slice of flask.Request the async handlers need"""
+
+    def __init__(self, scope, body):
+        self.headers = {name.decode('latin1').lower(): value.decode('latin1') for name, value in scope['headers']}
+        self.mimetype = self.headers.get('content-type', '').split(';')[0].strip().lower()
+        self.body = body
+
+    @property
+    def is_json(self):
+        return self.mimetype == 'application/json' or (self.mimetype.startswith('application/') and self.mimetype.endswith('+json'))
+
+    def get_json(self):
+        if not self.is_json:
+            raise ValueError('Content-Type must be application/json')
+        return json.loads(self.body)
+
+# ================================================================
+# ASYNC ROUTE HANDLERS - return (payload, status)
+# ================================================================
+
+async def analyze_bias(request):
+    """Async twin of app.analyze_bias"""
+    try:
+        if not request.is_json:
+            return {'error': 'Content-Type must be application/json'}, 400
+
+        validated_data = BiasAnalysisRequest(**request.get_json())
+        content = validated_data.content
+        campaign_type = validated_data.campaign_type
+        analysis_depth = validated_data.analysis_depth
+
+        logger.info(f"🔍 Async bias analysis for {campaign_type} campaign - Depth: {analysis_depth}")
+
+        detected_biases, overall_score, compliance_status = _detect_bias(content)
+
+        ai_analysis = None
+        if ai_client.available:
+            prompt, cache_inputs = _bias_ai_prompt(content, campaign_type, analysis_depth, detected_biases)
+            try:
+                ai_analysis = await ai_client.generate_json_async(prompt, cache_inputs=cache_inputs)
+            except Exception as e:
+                logger.warning(f"AI analysis failed: {e}")
+                ai_analysis = _bias_fallback_insights(content, detected_biases, overall_score)
+
+        final_results = _build_bias_results(
+            content, campaign_type, analysis_depth,
+            detected_biases, overall_score, compliance_status, ai_analysis
+        )
+
+        if validated_data.campaign_id:
+            final_results['stored_analysis'] = await asyncio.to_thread(
+                _store_bias_analysis, validated_data.campaign_id, detected_biases, final_results['overall_assessment']
+            )
+
+        return final_results, 200
+
+    except ValidationError as e:
+        logger.warning(f"Validation error: {e}")
+        return {'error': 'Invalid request format', 'details': e.errors()}, 400
+
+    except Exception as e:
+        logger.error(f"Async bias analysis failed: {e}")
+        return {'error': 'Analysis failed', 'details': str(e)}, 500
+
+async def explainable_ai_analysis(request):
+    """Async twin of app.explainable_ai_analysis"""
+    try:
+        data = request.get_json()
+        variant_data = data.get('variant_data', {})
+        analysis_type = data.get('analysis_type', 'performance')
+
+        if ai_client.available:
+            prompt, cache_inputs = _explainable_ai_prompt(variant_data, analysis_type)
+            try:
+                ai_explanation = await ai_client.generate_json_async(prompt, cache_inputs=cache_inputs)
+            except Exception as e:
+                logger.warning(f"AI explanation failed: {e}")
+                ai_explanation = _explainable_ai_fallback()
+        else:
+            ai_explanation = _explainable_ai_demo()
+
+        return _build_explainable_result(variant_data, analysis_type, ai_explanation), 200
+
+    except Exception as e:
+        logger.error(f"Async explainable AI analysis failed: {e}")
+        return {'error': 'AI explanation failed', 'details': str(e)}, 500
+
+async def analyze_ab_test(request):
+    """Async twin of app.analyze_ab_test"""
+    try:
+        validated_data = ABTestRequest(**request.get_json())
+
+        if validated_data.method not in AB_TEST_METHODS:
+            return {'error': f"method must be one of {', '.join(AB_TEST_METHODS)}"}, 400
+
+        logger.info(f"🧪 Async A/B test simulation: {validated_data.test_name}")
+
+        sim = _simulate_ab_test(validated_data)
+
+        if ai_client.available:
+            try:
+                ai_explanation = await ai_client.generate_json_async(_ab_test_ai_prompt(validated_data, sim))
+            except Exception as e:
+                logger.warning(f"Enhanced AI analysis failed: {e}")
+                ai_explanation = _generate_fallback_analysis(validated_data, sim['variant_lift'], sim['is_significant'], sim['confidence_level'])
+        else:
+            ai_explanation = _generate_fallback_analysis(validated_data, sim['variant_lift'], sim['is_significant'], sim['confidence_level'])
+
+        return _build_ab_test_results(validated_data, sim, ai_explanation), 200
+
+    except ValidationError as e:
+        logger.warning(f"Async A/B test validation error: {e}")
+        return {'error': 'Invalid request format', 'details': e.errors()}, 400
+
+    except Exception as e:
+        logger.error(f"Async A/B test analysis failed: {e}")
+        return {'error': 'Enhanced A/B test analysis failed', 'details': str(e)}, 500
+
+ASYNC_ROUTES = {
+    '/api/bias-analysis': analyze_bias,
+    '/api/explainable-ai': explainable_ai_analysis,
+    '/api/ab-test-analysis': analyze_ab_test
+}
+
+# ================================================================
+# ASGI APPLICATION
+# ================================================================
+
+class TrustEngineASGI:
+    """Dispatches POSTs to ASYNC_ROUTES natively and everything else to Flask"""
+
+    def __init__(self, wsgi_app):
+        self.wsgi = ThreadedWsgiToAsgi(wsgi_app)
+
+    async def __call__(self, scope, receive, send):
+        if scope['type'] == 'lifespan':
+            return await self._lifespan(receive, send)
+
+        handler = ASYNC_ROUTES.get(scope.get('path')) if scope['type'] == 'http' and scope['method'] == 'POST' else None
+        if handler is None:
+            return await self.wsgi(scope, receive, send)
+
+        body = bytearray()
+        while True:
+            message = await receive()
+            if message['type'] == 'http.disconnect':
+                return
+            body += message.get('body', b'')
+            if not message.get('more_body'):
+                break
+
+        request = JSONRequest(scope, bytes(body))
+        payload, status = await handler(request)
+        await self._send_json(request, payload, status, send)
+
+    async def _send_json(self, request, payload, status, send):
+        # Same bytes as jsonify: the app's JSON provider plus a trailing newline
+        response = flask_app.json.response(payload)
+        body, coding = response.get_data(), None
+        vary = []
+        if COMPRESSION_ENABLED:
+            vary.append('Accept-Encoding')
+            accept_encodings = parse_accept_header(request.headers.get('accept-encoding'))
+            body, coding = response_compressor.encode(body, accept_encodings)
+        headers = [
+            (b'content-type', response.content_type.encode('latin1')),
+            (b'content-length', str(len(body)).encode('latin1'))
+        ]
+        if coding:
+            headers.append((b'content-encoding', coding.encode('latin1')))
+        origin = request.headers.get('origin')
+        if origin and try_match_any_pattern(origin, CORS_ORIGINS, caseSensitive=False):
+            headers.append((b'access-control-allow-origin', origin.encode('latin1')))
+            vary.append('Origin')
+        if vary:
+            headers.append((b'vary', ', '.join(vary).encode('latin1')))
+        await send({'type': 'http.response.start', 'status': status, 'headers': headers})
+        await send({'type': 'http.response.body', 'body': body})
+
+    async def _lifespan(self, receive, send):
+        while True:
+            message = await receive()
+            if message['type'] == 'lifespan.startup':
+                logger.info(f"⚡ ASGI app ready - async routes: {', '.join(ASYNC_ROUTES)}")
+                await send({'type': 'lifespan.startup.complete'})
+            elif message['type'] == 'lifespan.shutdown':
+                wsgi_executor.shutdown(wait=False)
+                await send({'type': 'lifespan.shutdown.complete'})
+                return
+
+app = TrustEngineASGI(flask_app)
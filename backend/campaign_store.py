@@ -0,0 +1,721 @@
+# ================================================================
+# TRUST ENGINE - PERSISTENT CAMPAIGN STORE
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# SQLite (WAL mode) storage for campaigns, variants, bias analyses and
+# compliance reports. Each thread keeps one pooled connection, so API
+# worker threads read concurrently while a single writer commits. Scans
+# are keyset-paginated on (date column, primary key), which the indexes
+# below serve directly, so deep pages cost the same as the first one.
+# Background export and report jobs and streamed sequential A/B tests keep
+# their state here too, so every server process sharing the file sees the
+# same jobs and the same running totals.
+# ================================================================
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS store_meta (
+    key TEXT PRIMARY KEY,
+    value INTEGER NOT NULL
+);
+INSERT OR IGNORE INTO store_meta (key, value) VALUES ('revision', 0);
+
+CREATE TABLE IF NOT EXISTS campaigns (
+    campaign_id TEXT PRIMARY KEY,
+    name TEXT NOT NULL,
+    objective TEXT,
+    status TEXT NOT NULL,
+    variant TEXT,
+    platform TEXT,
+    impressions INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    revenue NUMERIC NOT NULL DEFAULT 0,
+    ctr NUMERIC,
+    trust_score NUMERIC,
+    bias_score NUMERIC,
+    compliance_score NUMERIC,
+    fairness_score NUMERIC,
+    budget NUMERIC,
+    audience_size INTEGER,
+    estimated_reach INTEGER,
+    privacy_compliant INTEGER,
+    mini_chart TEXT,
+    config TEXT,
+    created_by TEXT,
+    created_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_campaigns_created ON campaigns (created_date, campaign_id);
+CREATE INDEX IF NOT EXISTS idx_campaigns_status ON campaigns (status, created_date, campaign_id);
+
+CREATE TABLE IF NOT EXISTS variants (
+    variant_id TEXT PRIMARY KEY,
+    campaign_id TEXT NOT NULL REFERENCES campaigns (campaign_id) ON DELETE CASCADE,
+    name TEXT NOT NULL,
+    description TEXT,
+    config TEXT,
+    created_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_variants_campaign ON variants (campaign_id);
+
+CREATE TABLE IF NOT EXISTS bias_analyses (
+    analysis_id TEXT PRIMARY KEY,
+    campaign_id TEXT NOT NULL,
+    overall_bias_score NUMERIC,
+    gender_bias NUMERIC,
+    age_bias NUMERIC,
+    location_bias NUMERIC,
+    detected_issues INTEGER,
+    severity TEXT,
+    analysis_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_bias_campaign ON bias_analyses (campaign_id);
+CREATE INDEX IF NOT EXISTS idx_bias_date ON bias_analyses (analysis_date, analysis_id);
+
+CREATE TABLE IF NOT EXISTS compliance_reports (
+    report_id TEXT PRIMARY KEY,
+    campaign_id TEXT NOT NULL,
+    gdpr_compliance NUMERIC,
+    ccpa_compliance NUMERIC,
+    ada_compliance NUMERIC,
+    overall_score NUMERIC,
+    issues_found INTEGER,
+    report_date TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_compliance_campaign ON compliance_reports (campaign_id);
+CREATE INDEX IF NOT EXISTS idx_compliance_date ON compliance_reports (report_date, report_id);
+
+CREATE TABLE IF NOT EXISTS campaign_events (
+    event_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    campaign_id TEXT NOT NULL REFERENCES campaigns (campaign_id) ON DELETE CASCADE,
+    variant TEXT NOT NULL,
+    event_date TEXT NOT NULL,
+    impressions INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    revenue NUMERIC NOT NULL DEFAULT 0
+);
+CREATE INDEX IF NOT EXISTS idx_events_campaign ON campaign_events (campaign_id, event_date);
+
+-- Rollups below are maintained incrementally in the same transaction as the writes they summarise
+CREATE TABLE IF NOT EXISTS daily_rollups (
+    day TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    impressions INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    revenue NUMERIC NOT NULL DEFAULT 0,
+    trust_weighted NUMERIC NOT NULL DEFAULT 0,
+    trust_weight INTEGER NOT NULL DEFAULT 0,
+    analyses INTEGER NOT NULL DEFAULT 0,
+    bias_score_sum NUMERIC NOT NULL DEFAULT 0,
+    PRIMARY KEY (day, variant)
+);
+
+CREATE TABLE IF NOT EXISTS variant_rollups (
+    variant TEXT PRIMARY KEY,
+    campaigns INTEGER NOT NULL DEFAULT 0,
+    impressions INTEGER NOT NULL DEFAULT 0,
+    clicks INTEGER NOT NULL DEFAULT 0,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    revenue NUMERIC NOT NULL DEFAULT 0,
+    trust_score_sum NUMERIC NOT NULL DEFAULT 0,
+    trust_scores INTEGER NOT NULL DEFAULT 0,
+    bias_score_sum NUMERIC NOT NULL DEFAULT 0,
+    bias_scores INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS severity_rollups (
+    severity TEXT PRIMARY KEY,
+    analyses INTEGER NOT NULL DEFAULT 0,
+    bias_score_sum NUMERIC NOT NULL DEFAULT 0
+);
+
+-- Background job records (JSON), shared by every process using the file
+CREATE TABLE IF NOT EXISTS jobs (
+    job_id TEXT PRIMARY KEY,
+    kind TEXT NOT NULL,
+    status TEXT NOT NULL,
+    dedupe_key TEXT,
+    created_at REAL NOT NULL,
+    record TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_jobs_dedupe ON jobs (kind, dedupe_key, created_at);
+CREATE INDEX IF NOT EXISTS idx_jobs_created ON jobs (kind, created_at);
+
+-- Streamed sequential A/B tests: configuration (fixed by the first ingestion) and per-arm running state
+CREATE TABLE IF NOT EXISTS sequential_tests (
+    test_id TEXT PRIMARY KEY,
+    control_arm TEXT,
+    alpha REAL NOT NULL,
+    mixing_sd REAL NOT NULL,
+    events_ingested INTEGER NOT NULL DEFAULT 0,
+    looks INTEGER NOT NULL DEFAULT 0,
+    created_at TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    last_seen REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_sequential_seen ON sequential_tests (last_seen);
+
+CREATE TABLE IF NOT EXISTS sequential_arms (
+    test_id TEXT NOT NULL REFERENCES sequential_tests (test_id) ON DELETE CASCADE,
+    arm TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    exposures INTEGER NOT NULL DEFAULT 0,
+    conversions INTEGER NOT NULL DEFAULT 0,
+    min_p_value REAL NOT NULL DEFAULT 1.0,
+    decision TEXT,
+    PRIMARY KEY (test_id, arm)
+);
+"""
+
+# Rollup row for analyses whose campaign is not in the store
+UNASSIGNED_VARIANT = ''
+
+# Counters carried by every campaign event
+EVENT_METRICS = ('impressions', 'clicks', 'conversions', 'revenue')
+
+# Tables whose writes must go through the rollup-maintaining methods
+ROLLUP_SOURCES = ('campaigns', 'bias_analyses')
+
+# Per table: primary key, date column used for ordering/range filters, filterable columns
+TABLES = {
+    'campaigns': ('campaign_id', 'created_date', ('campaign_id', 'status', 'variant', 'platform')),
+    'variants': ('variant_id', 'created_date', ('campaign_id',)),
+    'bias_analyses': ('analysis_id', 'analysis_date', ('campaign_id', 'severity')),
+    'compliance_reports': ('report_id', 'report_date', ('campaign_id',))
+}
+
+# Fields of the public record shape per table (exports, reports, JSON payloads)
+RECORD_FIELDS = {
+    'campaigns': ['campaign_id', 'name', 'variant', 'ctr', 'trust_score', 'bias_score', 'compliance_score',
+                  'impressions', 'clicks', 'conversions', 'revenue', 'created_date', 'status'],
+    'variants': ['variant_id', 'campaign_id', 'name', 'description', 'created_date'],
+    'bias_analyses': ['analysis_id', 'campaign_id', 'overall_bias_score', 'gender_bias', 'age_bias',
+                      'location_bias', 'detected_issues', 'severity', 'analysis_date'],
+    'compliance_reports': ['report_id', 'campaign_id', 'gdpr_compliance', 'ccpa_compliance', 'ada_compliance',
+                           'overall_score', 'issues_found', 'report_date']
+}
+
+# Delivery details kept alongside campaign records
+CAMPAIGN_DETAIL_FIELDS = ['platform', 'mini_chart', 'budget', 'audience_size', 'fairness_score', 'privacy_compliant']
+
+# Range filters accepted by every table, applied to its date column
+DATE_FILTERS = ('date_from', 'date_to')
+
+# Columns stored as JSON text
+JSON_COLUMNS = ('config', 'mini_chart')
+
+# Job states after which a job record no longer changes
+FINISHED_JOB_STATES = ('completed', 'failed')
+
+# Page size bounds for list endpoints
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 1000
+
+class CapacityError(Exception):
+    """A bounded table is full"""
+
+def _decode(row):
+    record = dict(row)
+    for column in JSON_COLUMNS:
+        if record.get(column) is not None:
+            record[column] = json.loads(record[column])
+    if record.get('privacy_compliant') is not None:
+        record['privacy_compliant'] = bool(record['privacy_compliant'])
+    return record
+
+def _encode(record):
+    record = dict(record)
+    for column in JSON_COLUMNS:
+        if column in record and record[column] is not None:
+            record[column] = json.dumps(record[column])
+    return record
+
+def validate_filters(filters):
+    """Reject filter keys that no table understands"""
+    known = set(DATE_FILTERS).union(*(filterable for _, _, filterable in TABLES.values()))
+    unknown = sorted(set(filters or {}) - known)
+    if unknown:
+        raise ValueError(f"unsupported filter(s): {', '.join(unknown)}")
+    return dict(filters or {})
+
+def table_filters(table, filters):
+    """The subset of filters that applies to table"""
+    _, _, filterable = TABLES[table]
+    return {key: value for key, value in (filters or {}).items() if key in filterable or key in DATE_FILTERS}
+
+def validate_event(event, default_date):
+    """Normalise one delivery event: ISO date, optional variant and non-negative counters"""
+    if not isinstance(event, dict):
+        raise ValueError('each event must be an object')
+    day = str(event.get('date') or default_date)
+    datetime.strptime(day, '%Y-%m-%d')
+    counts = {}
+    for metric in EVENT_METRICS:
+        value = event.get(metric, 0)
+        value = float(value) if metric == 'revenue' else int(value)
+        if value < 0:
+            raise ValueError(f'{metric} must be non-negative')
+        counts[metric] = value
+    return {'date': day, 'variant': event.get('variant'), **counts}
+
+def encode_cursor(row, table):
+    pk, date_column, _ = TABLES[table]
+    return f'{row[date_column]}|{row[pk]}'
+
+class CampaignStore:
+    """SQLite campaign store with one pooled connection per thread"""
+
+    def __init__(self, path):
+        self.path = path
+        self._local = threading.local()
+        self._pid = os.getpid()
+        self._write_lock = threading.Lock()
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with self._write_lock:
+            self.connection().executescript(SCHEMA)
+
+    def connection(self):
+        """This thread's connection, opened on first use"""
+        if self._pid != os.getpid():
+            # Forked worker (e.g. gunicorn preload): never reuse the parent's connections
+            self._local = threading.local()
+            self._pid = os.getpid()
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0)
+            conn.row_factory = sqlite3.Row
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            conn.execute('PRAGMA foreign_keys=ON')
+            self._local.conn = conn
+        return conn
+
+    # ------------------------------------------------------------
+    # Writes
+    # ------------------------------------------------------------
+
+    def _insert(self, conn, table, record, replace=True):
+        record = _encode(record)
+        columns = ', '.join(record)
+        placeholders = ', '.join('?' for _ in record)
+        verb = 'INSERT OR REPLACE' if replace else 'INSERT'
+        conn.execute(f'{verb} INTO {table} ({columns}) VALUES ({placeholders})', list(record.values()))
+
+    def _bump_revision(self, conn):
+        conn.execute("UPDATE store_meta SET value = value + 1 WHERE key = 'revision'")
+
+    @property
+    def revision(self):
+        """Counter bumped by every committed write, shared by all processes using the file"""
+        return self.connection().execute("SELECT value FROM store_meta WHERE key = 'revision'").fetchone()[0]
+
+    def _bump(self, conn, table, keys, increments):
+        """Add increments to the rollup row identified by keys, creating it on first use"""
+        columns = [*keys, *increments]
+        updates = ', '.join(f'{column} = {column} + excluded.{column}' for column in increments)
+        conn.execute(
+            f"INSERT INTO {table} ({', '.join(columns)}) VALUES ({', '.join('?' for _ in columns)}) "
+            f"ON CONFLICT ({', '.join(keys)}) DO UPDATE SET {updates}",
+            [*keys.values(), *increments.values()]
+        )
+
+    def insert_many(self, table, records):
+        """Insert or replace rows of a table that feeds no rollup, in one transaction"""
+        if table not in TABLES or table in ROLLUP_SOURCES:
+            raise ValueError(f'insert_many does not accept {table}')
+        conn = self.connection()
+        with self._write_lock, conn:
+            for record in records:
+                self._insert(conn, table, record)
+            self._bump_revision(conn)
+
+    def create_campaign(self, campaign, variants=()):
+        """Persist a new campaign together with its variants atomically"""
+        conn = self.connection()
+        with self._write_lock, conn:
+            self._insert(conn, 'campaigns', campaign, replace=False)
+            for variant in variants:
+                self._insert(conn, 'variants', {**variant, 'campaign_id': campaign['campaign_id']})
+            trust, bias = campaign.get('trust_score'), campaign.get('bias_score')
+            self._bump(conn, 'variant_rollups', {'variant': campaign.get('variant') or UNASSIGNED_VARIANT}, {
+                'campaigns': 1,
+                **{metric: campaign.get(metric) or 0 for metric in EVENT_METRICS},
+                'trust_score_sum': trust or 0, 'trust_scores': int(trust is not None),
+                'bias_score_sum': bias or 0, 'bias_scores': int(bias is not None)
+            })
+            self._bump_revision(conn)
+        return self.get_campaign(campaign['campaign_id'])
+
+    def record_events(self, campaign_id, events):
+        """Append delivery events and fold them into campaign totals and rollups; returns the campaign totals"""
+        conn = self.connection()
+        with self._write_lock, conn:
+            campaign = conn.execute(
+                'SELECT variant, trust_score FROM campaigns WHERE campaign_id = ?', (campaign_id,)
+            ).fetchone()
+            if campaign is None:
+                raise KeyError(campaign_id)
+            totals = dict.fromkeys(EVENT_METRICS, 0)
+            for event in events:
+                variant = event.get('variant') or campaign['variant'] or UNASSIGNED_VARIANT
+                counts = {metric: event.get(metric, 0) for metric in EVENT_METRICS}
+                self._insert(conn, 'campaign_events', {
+                    'campaign_id': campaign_id, 'variant': variant, 'event_date': event['date'], **counts
+                }, replace=False)
+                has_trust = campaign['trust_score'] is not None
+                self._bump(conn, 'daily_rollups', {'day': event['date'], 'variant': variant}, {
+                    **counts,
+                    'trust_weighted': campaign['trust_score'] * counts['impressions'] if has_trust else 0,
+                    'trust_weight': counts['impressions'] if has_trust else 0
+                })
+                self._bump(conn, 'variant_rollups', {'variant': variant}, counts)
+                for metric in EVENT_METRICS:
+                    totals[metric] += counts[metric]
+            conn.execute(
+                'UPDATE campaigns SET impressions = impressions + ?, clicks = clicks + ?, '
+                'conversions = conversions + ?, revenue = revenue + ?, '
+                'ctr = CASE WHEN impressions + ? > 0 THEN ROUND(100.0 * (clicks + ?) / (impressions + ?), 2) END '
+                'WHERE campaign_id = ?',
+                [*totals.values(), totals['impressions'], totals['clicks'], totals['impressions'], campaign_id]
+            )
+            self._bump_revision(conn)
+        row = conn.execute(
+            'SELECT campaign_id, impressions, clicks, conversions, revenue, ctr FROM campaigns WHERE campaign_id = ?',
+            (campaign_id,)
+        ).fetchone()
+        return dict(row)
+
+    def add_bias_analysis(self, record):
+        """Persist a new bias analysis and fold it into the daily and severity rollups"""
+        conn = self.connection()
+        with self._write_lock, conn:
+            self._insert(conn, 'bias_analyses', record, replace=False)
+            campaign = conn.execute(
+                'SELECT variant FROM campaigns WHERE campaign_id = ?', (record['campaign_id'],)
+            ).fetchone()
+            score = record.get('overall_bias_score') or 0
+            self._bump(conn, 'daily_rollups', {
+                'day': record['analysis_date'],
+                'variant': (campaign['variant'] if campaign else None) or UNASSIGNED_VARIANT
+            }, {'analyses': 1, 'bias_score_sum': score})
+            self._bump(conn, 'severity_rollups', {'severity': record.get('severity') or 'unknown'},
+                       {'analyses': 1, 'bias_score_sum': score})
+            self._bump_revision(conn)
+        return record
+
+    # ------------------------------------------------------------
+    # Reads
+    # ------------------------------------------------------------
+
+    def get_campaign(self, campaign_id):
+        """Campaign with its variants, or None"""
+        conn = self.connection()
+        row = conn.execute('SELECT * FROM campaigns WHERE campaign_id = ?', (campaign_id,)).fetchone()
+        if row is None:
+            return None
+        campaign = _decode(row)
+        campaign['variants'] = [
+            _decode(v) for v in conn.execute(
+                'SELECT * FROM variants WHERE campaign_id = ? ORDER BY created_date, variant_id', (campaign_id,)
+            )
+        ]
+        return campaign
+
+    def _where(self, table, filters):
+        pk, date_column, filterable = TABLES[table]
+        clauses, params = [], []
+        for key, value in (filters or {}).items():
+            if value in (None, ''):
+                continue
+            if key in filterable:
+                clauses.append(f'{key} = ?')
+                params.append(value)
+            elif key == 'date_from':
+                clauses.append(f'{date_column} >= ?')
+                params.append(value)
+            elif key == 'date_to':
+                clauses.append(f'{date_column} <= ?')
+                params.append(value)
+            else:
+                raise ValueError(f'unsupported filter {key} for {table}')
+        return clauses, params
+
+    def scan(self, table, filters=None, limit=DEFAULT_PAGE_SIZE, cursor=None, columns=None):
+        """One keyset page ordered by (date, primary key); returns (rows, next_cursor)"""
+        if table not in TABLES:
+            raise ValueError(f'unknown table {table}')
+        pk, date_column, _ = TABLES[table]
+        limit = max(1, min(int(limit), MAX_PAGE_SIZE))
+        clauses, params = self._where(table, filters)
+        if cursor:
+            after_date, _, after_pk = cursor.partition('|')
+            clauses.append(f'({date_column}, {pk}) > (?, ?)')
+            params.extend([after_date, after_pk])
+        select = ', '.join(columns) if columns else '*'
+        if columns and (pk not in columns or date_column not in columns):
+            select = ', '.join(dict.fromkeys([*columns, pk, date_column]))
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        rows = self.connection().execute(
+            f'SELECT {select} FROM {table} {where} ORDER BY {date_column}, {pk} LIMIT ?', [*params, limit + 1]
+        ).fetchall()
+        next_cursor = encode_cursor(rows[limit - 1], table) if len(rows) > limit else None
+        records = [_decode(row) for row in rows[:limit]]
+        if columns:
+            records = [{column: record[column] for column in columns} for record in records]
+        return records, next_cursor
+
+    def iter_chunks(self, table, filters=None, chunk_rows=DEFAULT_PAGE_SIZE, columns=None):
+        """Every matching row, as successive keyset pages"""
+        cursor = None
+        while True:
+            rows, cursor = self.scan(table, filters, min(chunk_rows, MAX_PAGE_SIZE), cursor, columns)
+            if rows:
+                yield rows
+            if cursor is None:
+                return
+
+    def export_chunks(self, tables, filters=None, chunk_rows=DEFAULT_PAGE_SIZE, tag_table=False):
+        """Record-shaped row chunks across tables, each table getting the filters it supports"""
+        for table in tables:
+            for rows in self.iter_chunks(table, table_filters(table, filters), chunk_rows, RECORD_FIELDS[table]):
+                yield [{'table': table, **row} for row in rows] if tag_table else rows
+
+    def snapshot(self, tables, filters=None):
+        """{table: [records]} for the given tables"""
+        dataset = {table: [] for table in tables}
+        for table in tables:
+            for rows in self.iter_chunks(table, table_filters(table, filters), MAX_PAGE_SIZE, RECORD_FIELDS[table]):
+                dataset[table].extend(rows)
+        return dataset
+
+    def recent_campaigns(self, limit=10):
+        """Newest campaigns first, with their delivery details"""
+        columns = ', '.join(RECORD_FIELDS['campaigns'] + CAMPAIGN_DETAIL_FIELDS)
+        rows = self.connection().execute(
+            f'SELECT {columns} FROM campaigns ORDER BY created_date DESC, campaign_id DESC LIMIT ?', (limit,)
+        )
+        return [_decode(row) for row in rows]
+
+    def count(self, table, filters=None):
+        clauses, params = self._where(table, filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        return self.connection().execute(f'SELECT COUNT(*) FROM {table} {where}', params).fetchone()[0]
+
+    def campaign_totals(self, filters=None):
+        """Aggregate delivery and quality metrics over matching campaigns"""
+        clauses, params = self._where('campaigns', filters)
+        where = f"WHERE {' AND '.join(clauses)}" if clauses else ''
+        row = self.connection().execute(f"""
+            SELECT COUNT(*) AS total_campaigns,
+                   SUM(status = 'active') AS active_campaigns,
+                   SUM(status = 'completed') AS completed_campaigns,
+                   COALESCE(SUM(impressions), 0) AS total_impressions,
+                   COALESCE(SUM(clicks), 0) AS total_clicks,
+                   COALESCE(SUM(conversions), 0) AS total_conversions,
+                   COALESCE(SUM(revenue), 0) AS total_revenue,
+                   COALESCE(SUM(budget), 0) AS total_budget,
+                   AVG(trust_score) AS average_trust_score,
+                   AVG(bias_score) AS average_bias_score
+            FROM campaigns {where}
+        """, params).fetchone()
+        return dict(row)
+
+    # ------------------------------------------------------------
+    # Rollup reads (cost grows with days and variants, not events)
+    # ------------------------------------------------------------
+
+    def latest_rollup_day(self):
+        return self.connection().execute('SELECT MAX(day) FROM daily_rollups').fetchone()[0]
+
+    def daily_series(self, date_from, date_to, variant=None):
+        """{day: metrics} summed over variants (or for one variant) between two ISO dates"""
+        clause, params = ('AND variant = ?', [variant]) if variant is not None else ('', [])
+        rows = self.connection().execute(f"""
+            SELECT day, SUM(impressions) AS impressions, SUM(clicks) AS clicks,
+                   SUM(conversions) AS conversions, SUM(revenue) AS revenue,
+                   SUM(trust_weighted) AS trust_weighted, SUM(trust_weight) AS trust_weight,
+                   SUM(analyses) AS analyses, SUM(bias_score_sum) AS bias_score_sum
+            FROM daily_rollups WHERE day BETWEEN ? AND ? {clause}
+            GROUP BY day ORDER BY day
+        """, [date_from, date_to, *params])
+        return {row['day']: dict(row) for row in rows}
+
+    def variant_rollups(self):
+        rows = self.connection().execute(
+            'SELECT * FROM variant_rollups WHERE variant != ? ORDER BY variant', (UNASSIGNED_VARIANT,)
+        )
+        return [dict(row) for row in rows]
+
+    def severity_rollups(self):
+        return {row['severity']: dict(row) for row in self.connection().execute('SELECT * FROM severity_rollups')}
+
+    def is_empty(self):
+        return self.connection().execute('SELECT 1 FROM campaigns LIMIT 1').fetchone() is None
+
+    # ------------------------------------------------------------
+    # Background jobs (not campaign data, so the revision is left alone)
+    # ------------------------------------------------------------
+
+    def put_job(self, kind, job, dedupe_key=None):
+        """Record a new job; job is a JSON-ready dict carrying job_id and status"""
+        conn = self.connection()
+        with self._write_lock, conn:
+            conn.execute(
+                'INSERT INTO jobs (job_id, kind, status, dedupe_key, created_at, record) VALUES (?, ?, ?, ?, ?, ?)',
+                (job['job_id'], kind, job['status'], dedupe_key, time.time(), json.dumps(job))
+            )
+        return job
+
+    def get_job(self, kind, job_id):
+        row = self.connection().execute(
+            'SELECT record FROM jobs WHERE kind = ? AND job_id = ?', (kind, job_id)
+        ).fetchone()
+        return json.loads(row['record']) if row else None
+
+    def find_job(self, kind, dedupe_key, created_after):
+        """Newest job that did not fail for dedupe_key, created after an epoch time, or None"""
+        row = self.connection().execute(
+            "SELECT record FROM jobs WHERE kind = ? AND dedupe_key = ? AND created_at > ? AND status != 'failed' "
+            'ORDER BY created_at DESC LIMIT 1', (kind, dedupe_key, created_after)
+        ).fetchone()
+        return json.loads(row['record']) if row else None
+
+    def update_job(self, job_id, changes, expected_status=None):
+        """Merge changes into a job record; returns it, or None if its status is no longer expected_status"""
+        conn = self.connection()
+        with self._write_lock, conn:
+            # IMMEDIATE takes the file's write lock first, so other processes cannot interleave
+            conn.execute('BEGIN IMMEDIATE')
+            row = conn.execute('SELECT record FROM jobs WHERE job_id = ?', (job_id,)).fetchone()
+            if row is None:
+                return None
+            job = json.loads(row['record'])
+            if expected_status is not None and job['status'] != expected_status:
+                return None
+            job.update(changes)
+            conn.execute('UPDATE jobs SET status = ?, record = ? WHERE job_id = ?', (job['status'], json.dumps(job), job_id))
+        return job
+
+    def renew_job_leases(self, job_ids, lease_expires_at):
+        """Push out lease_expires_at on the records of the listed jobs that are still unfinished"""
+        if not job_ids:
+            return
+        finished = ', '.join('?' for _ in FINISHED_JOB_STATES)
+        placeholders = ', '.join('?' for _ in job_ids)
+        conn = self.connection()
+        with self._write_lock, conn:
+            conn.execute(
+                f"UPDATE jobs SET record = json_set(record, '$.lease_expires_at', ?) "
+                f'WHERE job_id IN ({placeholders}) AND status NOT IN ({finished})',
+                [lease_expires_at, *job_ids, *FINISHED_JOB_STATES]
+            )
+
+    def expire_jobs(self, kind, created_before, keep=None):
+        """Delete finished jobs created before an epoch time (or beyond the newest keep); returns their records"""
+        finished = ', '.join('?' for _ in FINISHED_JOB_STATES)
+        clause, params = 'created_at < ?', [created_before]
+        if keep is not None:
+            clause += ' OR job_id NOT IN (SELECT job_id FROM jobs WHERE kind = ? ORDER BY created_at DESC LIMIT ?)'
+            params += [kind, keep]
+        conn = self.connection()
+        with self._write_lock, conn:
+            rows = conn.execute(
+                f'SELECT job_id, record FROM jobs WHERE kind = ? AND status IN ({finished}) AND ({clause})',
+                [kind, *FINISHED_JOB_STATES, *params]
+            ).fetchall()
+            conn.executemany('DELETE FROM jobs WHERE job_id = ?', [(row['job_id'],) for row in rows])
+        return [json.loads(row['record']) for row in rows]
+
+    # ------------------------------------------------------------
+    # Sequential A/B tests (not campaign data, so the revision is left alone)
+    # ------------------------------------------------------------
+
+    def _sequential_state(self, conn, test_id):
+        test = conn.execute('SELECT * FROM sequential_tests WHERE test_id = ?', (test_id,)).fetchone()
+        if test is None:
+            return None
+        arms = conn.execute('SELECT * FROM sequential_arms WHERE test_id = ? ORDER BY position', (test_id,))
+        return {**dict(test), 'arms': [dict(arm) for arm in arms]}
+
+    def ingest_sequential(self, test_id, config, counts, events, max_tests=None, idle_before=None):
+        """Add per-arm counts to a sequential test atomically, creating it on first use.
+
+        config ({'control_arm', 'alpha', 'mixing_sd'}) only applies when the test is
+        created. counts is {arm: (exposures, conversions)} in first-seen order. Before
+        creating a test, tests idle since before the epoch time idle_before are dropped;
+        CapacityError is raised when max_tests tests still exist.
+        """
+        now = datetime.utcnow().isoformat()
+        conn = self.connection()
+        with self._write_lock, conn:
+            conn.execute('BEGIN IMMEDIATE')
+            if conn.execute('SELECT 1 FROM sequential_tests WHERE test_id = ?', (test_id,)).fetchone() is None:
+                if idle_before is not None:
+                    conn.execute('DELETE FROM sequential_tests WHERE last_seen < ?', (idle_before,))
+                if max_tests is not None and conn.execute('SELECT COUNT(*) FROM sequential_tests').fetchone()[0] >= max_tests:
+                    raise CapacityError(f'at most {max_tests} sequential tests can be live at once')
+                conn.execute(
+                    'INSERT INTO sequential_tests (test_id, control_arm, alpha, mixing_sd, created_at, updated_at, last_seen) '
+                    'VALUES (?, ?, ?, ?, ?, ?, ?)',
+                    (test_id, config['control_arm'], config['alpha'], config['mixing_sd'], now, now, time.time())
+                )
+                if config['control_arm']:
+                    conn.execute('INSERT INTO sequential_arms (test_id, arm, position) VALUES (?, ?, 0)',
+                                 (test_id, config['control_arm']))
+            for arm, (exposures, conversions) in counts.items():
+                conn.execute(
+                    'INSERT INTO sequential_arms (test_id, arm, position, exposures, conversions) '
+                    'VALUES (?, ?, (SELECT COUNT(*) FROM sequential_arms WHERE test_id = ?), ?, ?) '
+                    'ON CONFLICT (test_id, arm) DO UPDATE SET exposures = exposures + excluded.exposures, '
+                    'conversions = conversions + excluded.conversions',
+                    (test_id, arm, test_id, exposures, conversions)
+                )
+            # Without a configured control, the first arm ever seen is the control
+            conn.execute(
+                'UPDATE sequential_tests SET control_arm = COALESCE(control_arm, '
+                '(SELECT arm FROM sequential_arms WHERE test_id = ? ORDER BY position LIMIT 1)), '
+                'events_ingested = events_ingested + ?, updated_at = ?, last_seen = ? WHERE test_id = ?',
+                (test_id, events, now, time.time(), test_id)
+            )
+
+    def sequential_look(self, test_id, look):
+        """Run one look at a sequential test inside a write transaction, so looks from every process serialize.
+
+        look(state) gets the test with its arms and returns (result, {arm: (min_p_value, decision)});
+        running p-values are stored and a decision, once set, never changes. Returns result,
+        or None for an unknown test.
+        """
+        conn = self.connection()
+        with self._write_lock, conn:
+            conn.execute('BEGIN IMMEDIATE')
+            state = self._sequential_state(conn, test_id)
+            if state is None:
+                return None
+            state['looks'] += 1
+            result, updates = look(state)
+            conn.executemany(
+                'UPDATE sequential_arms SET min_p_value = MIN(min_p_value, ?), decision = COALESCE(decision, ?) '
+                'WHERE test_id = ? AND arm = ?',
+                [(min_p, decision, test_id, arm) for arm, (min_p, decision) in updates.items()]
+            )
+            conn.execute('UPDATE sequential_tests SET looks = looks + 1, last_seen = ? WHERE test_id = ?',
+                         (time.time(), test_id))
+        return result
+
+# ================================================================
+# WORKER-PROCESS ROW SOURCE
+# ================================================================
+
+def iter_store_chunks(path, tables, filters=None, chunk_rows=DEFAULT_PAGE_SIZE, tag_table=False):
+    """Record-shaped row chunks read with a fresh connection; picklable for process-pool exports"""
+    yield from CampaignStore(path).export_chunks(tables, filters, chunk_rows, tag_table)
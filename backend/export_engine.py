@@ -0,0 +1,169 @@
+# ================================================================
+# TRUST ENGINE - STREAMING EXPORT ENGINE
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Turns an iterator of row chunks into CSV or NDJSON text and, on
+# request, gzip-compresses it on the fly. Every stage is a generator, so
+# only one chunk of rows and one compressed block are alive at a time
+# regardless of how many rows the source yields. ChunkReader exposes the
+# resulting byte chunks as a read-only file object for send_file, and
+# write_export_file drives the same pipeline into a file on disk from a
+# worker process.
+# ================================================================
+
+import csv
+import io
+import json
+import os
+import zlib
+
+# Formats produced by encode_rows
+EXPORT_FORMATS = ('csv', 'ndjson')
+
+# Compression modes accepted by compress_chunks
+EXPORT_COMPRESSIONS = ('none', 'gzip')
+
+# Rows pulled from the data source per chunk
+DEFAULT_CHUNK_ROWS = 5000
+
+MIMETYPES = {
+    'csv': 'text/csv',
+    'ndjson': 'application/x-ndjson'
+}
+
+# ================================================================
+# ROW ENCODING
+# ================================================================
+
+class _LineBuffer:
+    """Write target for csv.writer that hands back what was written since the last drain"""
+
+    def __init__(self):
+        self.parts = []
+
+    def write(self, text):
+        self.parts.append(text)
+
+    def drain(self):
+        text = ''.join(self.parts)
+        self.parts.clear()
+        return text
+
+def csv_chunks(row_chunks, columns):
+    """CSV text per row chunk; columns is a list of (row key, header label)"""
+    buffer = _LineBuffer()
+    writer = csv.writer(buffer)
+    writer.writerow([header for _, header in columns])
+    yield buffer.drain()
+    keys = [key for key, _ in columns]
+    for rows in row_chunks:
+        writer.writerows([row.get(key, '') for key in keys] for row in rows)
+        yield buffer.drain()
+
+def ndjson_chunks(row_chunks, dumps=json.dumps):
+    """One JSON document per line, one text block per row chunk"""
+    for rows in row_chunks:
+        yield ''.join(dumps(row) + '\n' for row in rows)
+
+def encode_rows(row_chunks, export_format, columns=None, dumps=json.dumps):
+    """UTF-8 byte chunks for the requested export format"""
+    if export_format == 'csv':
+        text_chunks = csv_chunks(row_chunks, columns)
+    elif export_format == 'ndjson':
+        text_chunks = ndjson_chunks(row_chunks, dumps)
+    else:
+        raise ValueError(f"export format must be one of {', '.join(EXPORT_FORMATS)}")
+    for text in text_chunks:
+        if text:
+            yield text.encode('utf-8')
+
+def compress_chunks(byte_chunks, compression='none', level=6):
+    """Optionally gzip a stream of byte chunks without buffering the whole payload"""
+    if compression == 'none':
+        yield from byte_chunks
+        return
+    if compression != 'gzip':
+        raise ValueError(f"compression must be one of {', '.join(EXPORT_COMPRESSIONS)}")
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 31)  # wbits 31 = gzip container
+    for chunk in byte_chunks:
+        block = compressor.compress(chunk)
+        if block:
+            yield block
+    yield compressor.flush()
+
+# ================================================================
+# FILE OBJECT ADAPTER
+# ================================================================
+
+class ChunkReader(io.RawIOBase):
+    """Read-only, non-seekable file object over an iterator of byte chunks"""
+
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+        self._pending = memoryview(b'')
+
+    def readable(self):
+        return True
+
+    def readinto(self, buffer):
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def close(self):
+        close = getattr(self._chunks, 'close', None)
+        if close is not None:
+            close()
+        super().close()
+
+# ================================================================
+# EXPORT FILE WRITER (WORKER PROCESS)
+# ================================================================
+
+def _write_progress(progress_path, rows, size):
+    tmp_path = progress_path + '.tmp'
+    with open(tmp_path, 'w') as progress_file:
+        json.dump({'rows_written': rows, 'bytes_written': size}, progress_file)
+    os.replace(tmp_path, progress_path)
+
+def read_progress(path):
+    """Progress last reported by write_export_file for path, or None before it starts"""
+    try:
+        with open(path + '.progress') as progress_file:
+            return json.load(progress_file)
+    except (OSError, ValueError):
+        return None
+
+def write_export_file(path, row_source, source_args, export_format, compression='none', columns=None):
+    """Write an export to path chunk by chunk; meant to run in a worker process.
+
+    row_source(**source_args) must yield lists of row dicts. Output goes to
+    path + '.part' and is renamed to path only once complete, while a
+    path + '.progress' file tracks rows and bytes written after every chunk.
+    Returns {'rows': ..., 'size_bytes': ...}.
+    """
+    part_path, progress_path = path + '.part', path + '.progress'
+    rows = 0
+    with open(part_path, 'wb') as output:
+        def counted(chunks):
+            nonlocal rows
+            for chunk in chunks:
+                yield chunk
+                rows += len(chunk)
+                _write_progress(progress_path, rows, output.tell())
+
+        _write_progress(progress_path, 0, 0)
+        byte_chunks = encode_rows(counted(row_source(**source_args)), export_format, columns)
+        for block in compress_chunks(byte_chunks, compression):
+            output.write(block)
+
+    os.replace(part_path, path)
+    os.remove(progress_path)
+    return {'rows': rows, 'size_bytes': os.path.getsize(path)}
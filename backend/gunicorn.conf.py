@@ -0,0 +1,64 @@
+# ================================================================
+# TRUST ENGINE - GUNICORN PRODUCTION SERVER CONFIGURATION
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Start from the backend directory with:  gunicorn
+# (gunicorn reads ./gunicorn.conf.py automatically; -c gunicorn.conf.py
+# works too). The app is imported and warmed up once in the master, then
+# forked, so the bias matcher, persona code tables, Faker pools, power
+# grid and imported libraries are shared copy-on-write by all workers.
+# Every setting below can be overridden from the environment.
+# ================================================================
+
+import gc
+import multiprocessing
+import os
+
+# Preload and warm up in the master before forking
+preload_app = True
+if os.getenv('GUNICORN_WARMUP', '1') == '1':
+    os.environ.setdefault('WARMUP_ON_START', '1')
+
+bind = f"0.0.0.0:{os.getenv('PORT', '5000')}"
+
+# Worker processes (WEB_CONCURRENCY, else 2 x cores + 1) and threads per worker
+workers = int(os.getenv('WEB_CONCURRENCY', multiprocessing.cpu_count() * 2 + 1))
+threads = int(os.getenv('GUNICORN_THREADS', 4))
+
+# GUNICORN_ASGI=1 serves asgi:app on uvicorn workers: the AI endpoints become
+# coroutines (hundreds of awaited Gemini calls per worker) and the rest of the
+# API runs on a WSGI_BRIDGE_THREADS pool; otherwise plain Flask on gthread
+if os.getenv('GUNICORN_ASGI', '0') == '1':
+    wsgi_app = 'asgi:app'
+    worker_class = 'uvicorn_worker.UvicornWorker'
+else:
+    wsgi_app = 'app:app'
+    worker_class = 'gthread'
+
+# Recycle each worker after this many requests (jittered so they do not restart together)
+max_requests = int(os.getenv('GUNICORN_MAX_REQUESTS', 1000))
+max_requests_jitter = int(os.getenv('GUNICORN_MAX_REQUESTS_JITTER', 100))
+
+# Timeouts: long enough for Gemini calls and large streamed exports
+timeout = int(os.getenv('GUNICORN_TIMEOUT', 120))
+graceful_timeout = int(os.getenv('GUNICORN_GRACEFUL_TIMEOUT', 30))
+keepalive = int(os.getenv('GUNICORN_KEEPALIVE', 5))
+
+accesslog = os.getenv('GUNICORN_ACCESS_LOG', '-')
+errorlog = '-'
+loglevel = os.getenv('GUNICORN_LOG_LEVEL', 'info')
+
+def when_ready(server):
+    """Runs in the master after preloading, before workers are forked"""
+    # Move preloaded objects out of the collector's reach so GC passes in the
+    # workers do not touch (and therefore copy) the shared pages
+    gc.freeze()
+    per_worker = 'event loop' if wsgi_app == 'asgi:app' else f'{threads} threads'
+    server.log.info(
+        f"🚀 Trust Engine ready ({wsgi_app}): {workers} workers x {per_worker}, "
+        f"recycled every {max_requests}±{max_requests_jitter} requests"
+    )
+
+def post_fork(server, worker):
+    server.log.info(f"👷 Worker {worker.pid} booted")
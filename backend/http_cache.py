@@ -0,0 +1,177 @@
+# ================================================================
+# TRUST ENGINE - HTTP RESPONSE CACHE & COMPRESSION
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Keeps the serialized body of read-only GET responses keyed by endpoint,
+# query parameters and a data version, together with its compressed
+# variants (brotli and gzip), each produced once at the best level on the
+# first request that asks for it and reused until the entry expires. Each
+# variant carries a strong ETag derived from the bytes, so a poll that
+# revalidates with If-None-Match costs a dictionary lookup and an empty
+# 304. Entries expire after a per-endpoint TTL; a change of the data
+# version produces a new key, which is how writes invalidate them.
+# ResponseCompressor applies the same Accept-Encoding negotiation to
+# one-off responses (persona batches, exports, analyses) at faster levels.
+# ================================================================
+
+import gzip
+import hashlib
+import threading
+import time
+from email.utils import formatdate
+
+from cachetools import TLRUCache
+
+# Brotli is optional - without it only gzip is negotiated
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# Content codings we can produce, in order of preference when the client rates them equally
+CONTENT_CODINGS = ('br', 'gzip') if brotli is not None else ('gzip',)
+
+# ETag suffix of each compressed variant
+CODING_ETAG_SUFFIXES = {'br': '-br', 'gzip': '-gz'}
+
+# Bodies smaller than this are sent uncompressed
+DEFAULT_COMPRESS_MIN_BYTES = 1024
+
+# Levels for one-off responses (compressed on every request) ...
+FAST_LEVELS = {'br': 4, 'gzip': 6}
+# ... and for cached bodies, which are compressed once per entry
+BEST_LEVELS = {'br': 11, 'gzip': 9}
+
+# Cached bodies above this size use FAST_LEVELS (brotli 11 takes seconds on megabytes)
+MAX_BEST_LEVEL_BYTES = 256 * 1024
+
+def compress(body, coding, level):
+    """Encode body with a content coding from CONTENT_CODINGS"""
+    if coding == 'br':
+        return brotli.compress(body, quality=level)
+    # mtime=0 keeps the compressed bytes (and so their ETag) identical for identical bodies
+    return gzip.compress(body, compresslevel=level, mtime=0)
+
+def negotiate(accept_encodings, codings=CONTENT_CODINGS):
+    """Best coding the client accepts (a werkzeug Accept), or None for identity"""
+    best, best_quality = None, 0
+    for coding in codings:
+        quality = accept_encodings.quality(coding)
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+class CachedResponse:
+    """Immutable serialized response body with its validators and compressed variants"""
+
+    __slots__ = ('body', 'encoded', 'mimetype', 'etag', 'last_modified', 'expires_at', 'compressible')
+
+    def __init__(self, body, mimetype, ttl, compress_min_bytes=DEFAULT_COMPRESS_MIN_BYTES):
+        self.body = body
+        self.mimetype = mimetype
+        self.compressible = len(body) >= compress_min_bytes
+        # coding -> compressed bytes, or None when compression did not make it smaller
+        self.encoded = {}
+        self.etag = hashlib.sha256(body).hexdigest()[:32]
+        now = time.time()
+        self.last_modified = formatdate(now, usegmt=True)
+        self.expires_at = time.monotonic() + ttl
+
+    def _encoded(self, coding):
+        if coding not in self.encoded:
+            # Two first requests may both compress; the results are identical
+            levels = BEST_LEVELS if len(self.body) <= MAX_BEST_LEVEL_BYTES else FAST_LEVELS
+            data = compress(self.body, coding, levels[coding])
+            self.encoded[coding] = data if len(data) < len(self.body) else None
+        return self.encoded[coding]
+
+    def representation(self, coding):
+        """(body, content coding or None, etag) for the negotiated coding"""
+        if coding is not None and self.compressible:
+            data = self._encoded(coding)
+            if data is not None:
+                return data, coding, self.etag + CODING_ETAG_SUFFIXES[coding]
+        return self.body, None, self.etag
+
+class HTTPResponseCache:
+    """Thread-safe LRU of CachedResponse entries with per-entry expiry"""
+
+    def __init__(self, maxsize=512, compress_min_bytes=DEFAULT_COMPRESS_MIN_BYTES):
+        self.compress_min_bytes = compress_min_bytes
+        self._entries = TLRUCache(maxsize=maxsize, ttu=lambda key, entry, now: entry.expires_at, timer=time.monotonic)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return entry
+
+    def put(self, key, body, mimetype, ttl):
+        entry = CachedResponse(body, mimetype, ttl, self.compress_min_bytes)
+        with self._lock:
+            self._entries[key] = entry
+        return entry
+
+    def invalidate(self, endpoint=None):
+        """Drop every entry, or only those of one endpoint"""
+        with self._lock:
+            if endpoint is None:
+                self._entries.clear()
+                return
+            for key in [key for key in self._entries.keys() if key[0] == endpoint]:
+                del self._entries[key]
+
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': round(self.hits / lookups, 4) if lookups else 0.0
+            }
+
+class ResponseCompressor:
+    """Accept-Encoding negotiation and compression for responses that are not cached"""
+
+    def __init__(self, min_bytes=DEFAULT_COMPRESS_MIN_BYTES, codings=CONTENT_CODINGS):
+        self.min_bytes = min_bytes
+        self.codings = codings
+        self._lock = threading.Lock()
+        self.compressed = {coding: 0 for coding in codings}
+        self.bytes_in = 0
+        self.bytes_out = 0
+
+    def encode(self, body, accept_encodings):
+        """(body, content coding or None) - body is returned as-is when not worth compressing"""
+        if len(body) < self.min_bytes:
+            return body, None
+        coding = negotiate(accept_encodings, self.codings)
+        if coding is None:
+            return body, None
+        data = compress(body, coding, FAST_LEVELS[coding])
+        if len(data) >= len(body):
+            return body, None
+        with self._lock:
+            self.compressed[coding] += 1
+            self.bytes_in += len(body)
+            self.bytes_out += len(data)
+        return data, coding
+
+    def stats(self):
+        with self._lock:
+            return {
+                'codings': list(self.codings),
+                'min_bytes': self.min_bytes,
+                'compressed_responses': dict(self.compressed),
+                'bytes_in': self.bytes_in,
+                'bytes_out': self.bytes_out,
+                'ratio': round(self.bytes_in / self.bytes_out, 2) if self.bytes_out else None
+            }
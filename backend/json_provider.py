@@ -0,0 +1,201 @@
+# ================================================================
+# TRUST ENGINE - FAST JSON PROVIDER
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Flask JSON provider that encodes jsonify() responses with orjson when it
+# is installed. The output is held to the bytes Flask's standard-library
+# encoder would produce (sorted keys, compact separators, ASCII-escaped
+# text): non-ASCII characters are re-escaped, and any payload orjson
+# would write differently (exponent floats, integers beyond 64 bits,
+# non-string keys, unsupported types) is re-encoded on the stdlib path.
+# The one deliberate difference: NaN and Infinity become null, where the
+# stdlib writes bare NaN tokens that JSON.parse rejects outright.
+# Floats can optionally be rounded once here, just before encoding, instead
+# of at every call site. Run this module to benchmark both encoders on the
+# payloads of the largest endpoints.
+# ================================================================
+
+import json
+import re
+import threading
+import time
+
+from flask.json.provider import DefaultJSONProvider
+
+# Optional accelerated encoder - the stdlib encoder is used when it is missing
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Encoders selectable with JSON_ENCODER
+JSON_ENCODERS = ('orjson', 'stdlib')
+
+# Separators jsonify() passes outside debug mode - the only layout orjson writes
+COMPACT_SEPARATORS = (',', ':')
+
+# orjson writes 1e-05 as 0.00001 and 1e+16 as 1e16. Payloads with either shape are
+# re-encoded with the stdlib encoder; both checks are plain substring scans, so a
+# rare look-alike inside a string (a hex id such as "3e5a") only costs a fallback
+_SMALL_FIXED_FLOAT = b'0.0000'
+_EXPONENT = b'0e0'
+_DIGITS_AS_ZERO = bytes.maketrans(b'123456789-', b'0000000000')
+
+# Bytes ensure_ascii leaves alone; deleting them leaves just the characters to escape
+_PLAIN_ASCII = bytes(range(0x7f))
+
+# Above this many distinct characters to escape, one regex pass beats a replace per character
+MAX_ESCAPE_REPLACES = 8
+
+_ESCAPED_CHARACTER = re.compile('[\x7f-\U0010ffff]')
+
+def _escape_character(char):
+    code = ord(char)
+    if code < 0x10000:
+        return f'\\u{code:04x}'
+    code -= 0x10000
+    return f'\\u{0xd800 | (code >> 10):04x}\\u{0xdc00 | (code & 0x3ff):04x}'
+
+def ascii_escape(data):
+    """Escape orjson's raw UTF-8 (and DEL) the way json.dumps(ensure_ascii=True) does"""
+    chars = set(data.translate(None, _PLAIN_ASCII).decode())
+    if len(chars) > MAX_ESCAPE_REPLACES:
+        return _ESCAPED_CHARACTER.sub(lambda match: _escape_character(match.group()), data.decode()).encode()
+    for char in chars:
+        data = data.replace(char.encode(), _escape_character(char).encode())
+    return data
+
+def round_floats(obj, digits):
+    """Copy of a JSON-ready structure with every float rounded to digits decimals"""
+    if isinstance(obj, float):
+        return round(obj, digits)
+    if isinstance(obj, dict):
+        return {key: round_floats(value, digits) for key, value in obj.items()}
+    if isinstance(obj, (list, tuple)):
+        return [round_floats(value, digits) for value in obj]
+    return obj
+
+class FastJSONProvider(DefaultJSONProvider):
+    """DefaultJSONProvider that encodes with orjson when it can reproduce the stdlib bytes"""
+
+    def __init__(self, app, encoder=None, float_digits=None):
+        super().__init__(app)
+        if encoder is not None and encoder not in JSON_ENCODERS:
+            raise ValueError(f"encoder must be one of {', '.join(JSON_ENCODERS)}")
+        self.encoder = 'stdlib' if orjson is None else (encoder or 'orjson')
+        self.float_digits = float_digits
+        self.fast_encodes = 0
+        self.stdlib_fallbacks = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _orjson_default(o):
+        # Float subclasses (numpy.float64) print like floats in the stdlib encoder
+        if isinstance(o, float):
+            return float(o)
+        return DefaultJSONProvider.default(o)
+
+    def _orjson_dumps(self, obj):
+        """Compact orjson encoding identical to the stdlib bytes, or None to fall back"""
+        options = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if self.sort_keys:
+            options |= orjson.OPT_SORT_KEYS
+        try:
+            data = orjson.dumps(obj, default=self._orjson_default, option=options)
+        except TypeError:  # orjson.JSONEncodeError included
+            return None
+        if _SMALL_FIXED_FLOAT in data or _EXPONENT in data.translate(_DIGITS_AS_ZERO):
+            return None
+        if self.ensure_ascii and (not data.isascii() or b'\x7f' in data):
+            data = ascii_escape(data)
+        return data
+
+    def encode_compact(self, obj):
+        """Compact JSON bytes for obj, as jsonify() writes them"""
+        if self.float_digits is not None:
+            obj = round_floats(obj, self.float_digits)
+        if self.encoder == 'orjson':
+            data = self._orjson_dumps(obj)
+            with self._lock:
+                if data is None:
+                    self.stdlib_fallbacks += 1
+                else:
+                    self.fast_encodes += 1
+            if data is not None:
+                return data
+        return super().dumps(obj, separators=COMPACT_SEPARATORS).encode()
+
+    def dumps(self, obj, **kwargs):
+        if kwargs.keys() == {'separators'} and tuple(kwargs['separators']) == COMPACT_SEPARATORS:
+            return self.encode_compact(obj).decode()
+        if self.float_digits is not None:
+            obj = round_floats(obj, self.float_digits)
+        return super().dumps(obj, **kwargs)
+
+    def response(self, *args, **kwargs):
+        # Pretty-printed (debug) responses keep the stdlib layout
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(self.encode_compact(obj) + b'\n', mimetype=self.mimetype)
+
+    def stats(self):
+        with self._lock:
+            return {
+                'encoder': self.encoder,
+                'float_digits': self.float_digits,
+                'fast_encodes': self.fast_encodes,
+                'stdlib_fallbacks': self.stdlib_fallbacks
+            }
+
+# ================================================================
+# BENCHMARK - python json_provider.py [repeats]
+# ================================================================
+
+# (label, method, path, JSON body) of the endpoints whose payloads are benchmarked
+BENCHMARK_REQUESTS = (
+    ('generate_personas (1000)', 'POST', '/api/generate-personas', {'count': 1000, 'seed': 7}),
+    ('generate_personas (10000)', 'POST', '/api/generate-personas', {'count': 10000, 'seed': 7}),
+    ('get_demo_data', 'GET', '/api/demo-data', None),
+    ('data_export (json)', 'POST', '/api/data-export', {'export_type': 'json', 'data_selection': 'all'})
+)
+
+def _best_of(func, repeats):
+    best = float('inf')
+    for _ in range(repeats):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+def benchmark(flask_app, repeats=20):
+    """Time both encoders on each endpoint's payload; also checks the bytes are identical"""
+    client = flask_app.test_client()
+    stdlib = FastJSONProvider(flask_app, encoder='stdlib')
+    fast = FastJSONProvider(flask_app, encoder='orjson')
+    results = []
+    for label, method, path, body in BENCHMARK_REQUESTS:
+        response = client.open(path, method=method, json=body, headers={'Accept-Encoding': 'identity'})
+        payload = json.loads(response.get_data())
+        stdlib_ms = _best_of(lambda: stdlib.encode_compact(payload), repeats) * 1000
+        fast_ms = _best_of(lambda: fast.encode_compact(payload), repeats) * 1000
+        results.append({
+            'endpoint': label,
+            'bytes': len(response.get_data()),
+            'stdlib_ms': round(stdlib_ms, 2),
+            'orjson_ms': round(fast_ms, 2),
+            'speedup': round(stdlib_ms / fast_ms, 1),
+            'byte_identical': stdlib.encode_compact(payload) == fast.encode_compact(payload)
+        })
+    return results
+
+if __name__ == '__main__':
+    import sys
+    from app import app as trust_engine_app
+
+    if orjson is None:
+        sys.exit('orjson is not installed - nothing to compare')
+    print(f"{'endpoint':28} {'bytes':>10} {'stdlib ms':>10} {'orjson ms':>10} {'speedup':>8}  identical")
+    for row in benchmark(trust_engine_app, int(sys.argv[1]) if len(sys.argv) > 1 else 20):
+        print(f"{row['endpoint']:28} {row['bytes']:>10} {row['stdlib_ms']:>10} {row['orjson_ms']:>10} {row['speedup']:>7}x  {row['byte_identical']}")
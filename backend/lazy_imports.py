@@ -0,0 +1,100 @@
+# ================================================================
+# TRUST ENGINE - DEFERRED IMPORTS & STARTUP REPORT
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Heavy dependencies (the Gemini SDK, SciPy, NumPy, Faker, ReportLab) are
+# bound to LazyModule stand-ins that import the real module on first
+# attribute access, so a worker that only serves health checks and cached
+# dashboards never pays for them. StartupReport records how long each
+# boot phase and each deferred import took, for logs and the monitor.
+# ================================================================
+
+import importlib
+import sys
+import threading
+import time
+
+def max_rss_mb():
+    """Peak resident set size of this process in MB, or None where getrusage is unavailable (Windows)"""
+    try:
+        import resource
+    except ImportError:
+        return None
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # macOS reports bytes, Linux and the BSDs kilobytes
+    return round(max_rss / (1024 * 1024 if sys.platform == 'darwin' else 1024), 1)
+
+class StartupReport:
+    """Per-component timings for module boot and for deferred imports"""
+
+    def __init__(self, started=None):
+        self.started = time.perf_counter() if started is None else started
+        self._last_mark = self.started
+        self.boot = {}
+        self.deferred = {}
+        self.boot_ms = None
+        self._lock = threading.Lock()
+
+    def mark(self, component):
+        """Attribute the time since the previous mark to component"""
+        now = time.perf_counter()
+        self.boot[component] = round((now - self._last_mark) * 1000, 1)
+        self._last_mark = now
+
+    def finish(self):
+        """Close the boot phase; later loads are reported as deferred"""
+        self.boot_ms = round((time.perf_counter() - self.started) * 1000, 1)
+
+    def record_deferred(self, component, seconds, trigger):
+        with self._lock:
+            self.deferred[component] = {'load_ms': round(seconds * 1000, 1), 'trigger': trigger}
+
+    def summary(self):
+        """One log line: total boot time and its slowest components"""
+        parts = ', '.join(f'{name} {ms:.0f}ms' for name, ms in sorted(self.boot.items(), key=lambda item: -item[1]))
+        return f'{self.boot_ms:.0f}ms ({parts})'
+
+    def to_dict(self):
+        with self._lock:
+            deferred = dict(self.deferred)
+        return {
+            'boot_ms': self.boot_ms,
+            'boot_components_ms': dict(self.boot),
+            'deferred_imports': deferred,
+            'max_rss_mb': max_rss_mb()
+        }
+
+class LazyModule:
+    """Stand-in for a module that is imported on first attribute access"""
+
+    def __init__(self, name, report, component=None):
+        self._name = name
+        self._report = report
+        self._component = component or name
+        self._module = None
+        self._lock = threading.Lock()
+
+    @property
+    def loaded(self):
+        return self._module is not None
+
+    def load(self, trigger='first_use'):
+        """Import the module now (if not yet imported) and return it"""
+        if self._module is None:
+            with self._lock:
+                if self._module is None:
+                    already_imported = self._name in sys.modules
+                    start = time.perf_counter()
+                    module = importlib.import_module(self._name)
+                    if not already_imported:
+                        self._report.record_deferred(self._component, time.perf_counter() - start, trigger)
+                    self._module = module
+        return self._module
+
+    def __getattr__(self, attr):
+        return getattr(self.load(), attr)
+
+    def __repr__(self):
+        state = 'loaded' if self.loaded else 'deferred'
+        return f'<LazyModule {self._name} ({state})>'
@@ -0,0 +1,162 @@
+# ================================================================
+# TRUST ENGINE - PDF REPORT RENDERER
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Renders the data-export PDF report with ReportLab. The report always
+# carries the five standard sections; tables outside the requested data
+# selection are reported as not selected. Rendering is pure (dataset in,
+# bytes out) and uses ReportLab's invariant mode, so the same inputs give
+# byte-identical files and the output can be cached by its inputs.
+# ================================================================
+
+import io
+from xml.sax.saxutils import escape
+
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.lib.units import mm
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+REPORT_SECTIONS = ['Executive Summary', 'Campaign Performance', 'Bias Analysis', 'Compliance Report', 'Recommendations']
+
+# Thresholds that turn metrics into recommendations
+BIAS_SCORE_LIMIT = 0.10
+COMPLIANCE_SCORE_LIMIT = 90
+TRUST_SCORE_LIMIT = 80
+
+_styles = getSampleStyleSheet()
+
+_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#1f2937')),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, -1), 8),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.HexColor('#f3f4f6')]),
+    ('GRID', (0, 0), (-1, -1), 0.25, colors.HexColor('#9ca3af')),
+    ('VALIGN', (0, 0), (-1, -1), 'MIDDLE')
+])
+
+def _table(columns, rows):
+    """Styled table from (key, header) columns and row dicts"""
+    data = [[header for _, header in columns]]
+    data.extend(['' if row.get(key) is None else str(row[key]) for key, _ in columns] for row in rows)
+    table = Table(data, repeatRows=1, hAlign='LEFT')
+    table.setStyle(_TABLE_STYLE)
+    return table
+
+def _mean(rows, key):
+    values = [row[key] for row in rows if row.get(key) is not None]
+    return sum(values) / len(values) if values else 0
+
+def report_recommendations(campaigns, bias_analyses, compliance_reports):
+    """Rule-based recommendations derived from the report data"""
+    recommendations = []
+    for campaign in campaigns:
+        if (campaign.get('bias_score') or 0) > BIAS_SCORE_LIMIT:
+            recommendations.append(
+                f"{campaign['name']} ({campaign['campaign_id']}): bias score {campaign['bias_score']} exceeds "
+                f"{BIAS_SCORE_LIMIT}; review creative language and targeting."
+            )
+        if campaign.get('compliance_score') is not None and campaign['compliance_score'] < COMPLIANCE_SCORE_LIMIT:
+            recommendations.append(
+                f"{campaign['name']} ({campaign['campaign_id']}): compliance score {campaign['compliance_score']} "
+                f"is below {COMPLIANCE_SCORE_LIMIT}; schedule a privacy review."
+            )
+        if campaign.get('trust_score') is not None and campaign['trust_score'] < TRUST_SCORE_LIMIT:
+            recommendations.append(
+                f"{campaign['name']} ({campaign['campaign_id']}): trust score {campaign['trust_score']} is below "
+                f"{TRUST_SCORE_LIMIT}; add transparency and credibility signals."
+            )
+    for analysis in bias_analyses:
+        if analysis.get('severity') == 'high':
+            recommendations.append(
+                f"Bias analysis {analysis['analysis_id']} flagged {analysis['detected_issues']} high-severity issues "
+                f"for {analysis['campaign_id']}; remediate before scaling spend."
+            )
+    for report in compliance_reports:
+        if report.get('issues_found'):
+            recommendations.append(
+                f"Compliance report {report['report_id']} lists {report['issues_found']} open issue(s) "
+                f"for {report['campaign_id']}."
+            )
+    if campaigns:
+        best = max(campaigns, key=lambda c: c.get('ctr') or 0)
+        recommendations.append(
+            f"Scale learnings from {best['name']} (variant {best['variant']}), the highest CTR at {best['ctr']}%."
+        )
+    return recommendations or ['No issues detected in the selected data.']
+
+def render_report(dataset, tables, columns, data_selection, date_range, generated_at):
+    """Render the five-section report; returns (pdf bytes, page count)"""
+    campaigns = dataset.get('campaigns', []) if 'campaigns' in tables else []
+    bias_analyses = dataset.get('bias_analyses', []) if 'bias_analyses' in tables else []
+    compliance_reports = dataset.get('compliance_reports', []) if 'compliance_reports' in tables else []
+
+    h1, h2, body = _styles['Title'], _styles['Heading2'], _styles['BodyText']
+    not_selected = Paragraph('Not included in this data selection.', body)
+    story = [
+        Paragraph('Trust Engine Campaign Report', h1),
+        Paragraph(escape(f'Data selection: {data_selection} | Date range: {date_range} | Generated: {generated_at}'), body),
+        Spacer(1, 6 * mm)
+    ]
+
+    # Executive Summary
+    story.append(Paragraph(REPORT_SECTIONS[0], h2))
+    if campaigns:
+        impressions = sum(c['impressions'] for c in campaigns)
+        clicks = sum(c['clicks'] for c in campaigns)
+        summary_rows = [
+            {'metric': 'Campaigns', 'value': len(campaigns)},
+            {'metric': 'Active campaigns', 'value': sum(c['status'] == 'active' for c in campaigns)},
+            {'metric': 'Impressions', 'value': f'{impressions:,}'},
+            {'metric': 'Clicks', 'value': f'{clicks:,}'},
+            {'metric': 'Conversions', 'value': f"{sum(c['conversions'] for c in campaigns):,}"},
+            {'metric': 'Revenue', 'value': f"${sum(c['revenue'] for c in campaigns):,}"},
+            {'metric': 'Blended CTR', 'value': f'{clicks / impressions * 100:.2f}%' if impressions else 'n/a'},
+            {'metric': 'Average trust score', 'value': f"{_mean(campaigns, 'trust_score'):.1f}"},
+            {'metric': 'Average bias score', 'value': f"{_mean(campaigns, 'bias_score'):.3f}"}
+        ]
+        story.append(_table([('metric', 'Metric'), ('value', 'Value')], summary_rows))
+    else:
+        story.append(Paragraph(
+            f'{len(bias_analyses)} bias analyses and {len(compliance_reports)} compliance reports in this selection.', body
+        ))
+
+    # Campaign Performance
+    story.extend([Spacer(1, 4 * mm), Paragraph(REPORT_SECTIONS[1], h2)])
+    story.append(_table(columns['campaigns'], campaigns) if campaigns else not_selected)
+
+    # Bias Analysis
+    story.extend([Spacer(1, 4 * mm), Paragraph(REPORT_SECTIONS[2], h2)])
+    if bias_analyses:
+        story.append(Paragraph(
+            f"Average overall bias score {_mean(bias_analyses, 'overall_bias_score'):.1f}; "
+            f"{sum(a['severity'] == 'high' for a in bias_analyses)} high-severity analyses.", body
+        ))
+        story.append(_table(columns['bias_analyses'], bias_analyses))
+    else:
+        story.append(not_selected)
+
+    # Compliance Report
+    story.extend([Spacer(1, 4 * mm), Paragraph(REPORT_SECTIONS[3], h2)])
+    if compliance_reports:
+        story.append(Paragraph(f"Average overall compliance score {_mean(compliance_reports, 'overall_score'):.1f}.", body))
+        story.append(_table(columns['compliance_reports'], compliance_reports))
+    else:
+        story.append(not_selected)
+
+    # Recommendations
+    story.extend([Spacer(1, 4 * mm), Paragraph(REPORT_SECTIONS[4], h2)])
+    for recommendation in report_recommendations(campaigns, bias_analyses, compliance_reports):
+        story.append(Paragraph(f'• {escape(recommendation)}', body))
+
+    buffer = io.BytesIO()
+    doc = SimpleDocTemplate(
+        buffer, pagesize=landscape(A4), invariant=True,
+        leftMargin=15 * mm, rightMargin=15 * mm, topMargin=15 * mm, bottomMargin=15 * mm,
+        title='Trust Engine Campaign Report', author='Trust Engine'
+    )
+    doc.build(story)
+    return buffer.getvalue(), doc.page
@@ -0,0 +1,13 @@
+# ================================================================
+# TRUST ENGINE - TEST CONFIGURATION
+# ================================================================
+# Team: Halo | Platform: Privacy-First A/B Testing with AI-Powered Analytics
+#
+# Run from the backend directory with:  python -m pytest -q tests
+# ================================================================
+
+import os
+import sys
+
+# The backend modules are imported as top-level modules, as app.py does
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
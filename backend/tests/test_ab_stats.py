@@ -0,0 +1,119 @@
+# ================================================================
+# TRUST ENGINE - A/B STATISTICS TESTS
+# ================================================================
+
+import numpy as np
+import pytest
+
+import ab_stats
+
+# ================================================================
+# FREQUENTIST COMPARISONS
+# ================================================================
+
+def test_z_test_matches_hand_computed_reference():
+    # Pooled rate 0.11, SE sqrt(0.11 * 0.89 * 2 / 1000); unpooled SE for the interval
+    result = ab_stats.compare_to_control([[1000, 1000]], [[100, 120]], correction='none')
+    assert result['difference'][0, 0] == pytest.approx(0.02)
+    assert result['relative_lift'][0, 0] == pytest.approx(0.2)
+    assert result['z_score'][0, 0] == pytest.approx(1.4293008498, rel=1e-9)
+    assert result['p_value'][0, 0] == pytest.approx(0.1529177819, rel=1e-8)
+    assert result['difference_lower'][0, 0] == pytest.approx(-0.0074114820, rel=1e-8)
+    assert result['difference_upper'][0, 0] == pytest.approx(0.0474114820, rel=1e-8)
+    assert not result['significant'][0, 0]
+
+def test_z_test_without_conversions_is_not_significant():
+    result = ab_stats.compare_to_control([[500, 500]], [[0, 0]])
+    assert result['z_score'][0, 0] == 0.0
+    assert result['p_value'][0, 0] == pytest.approx(1.0)
+
+@pytest.mark.parametrize('method, expected', [
+    # Reference values from R's p.adjust
+    ('holm', [0.03, 0.06, 0.06, 0.02]),
+    ('fdr_bh', [0.02, 0.04, 0.04, 0.02]),
+    ('bonferroni', [0.04, 0.16, 0.12, 0.02])
+])
+def test_adjust_pvalues_reference_values(method, expected):
+    adjusted = ab_stats.adjust_pvalues([[0.01, 0.04, 0.03, 0.005]], method)
+    assert adjusted[0] == pytest.approx(expected)
+
+def test_adjust_pvalues_ignores_padded_arms_per_row():
+    p_values = [[0.01, 0.04, np.nan], [0.02, 0.5, 0.9]]
+    holm = ab_stats.adjust_pvalues(p_values, 'holm')
+    assert holm[0, :2] == pytest.approx([0.02, 0.04]) and np.isnan(holm[0, 2])
+    assert holm[1] == pytest.approx([0.06, 1.0, 1.0])
+    bh = ab_stats.adjust_pvalues(p_values, 'fdr_bh')
+    assert bh[0, :2] == pytest.approx([0.02, 0.04]) and np.isnan(bh[0, 2])
+    assert bh[1] == pytest.approx([0.06, 0.75, 0.9])
+
+def test_adjust_pvalues_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        ab_stats.adjust_pvalues([0.01], 'sidak')
+
+# ================================================================
+# BAYESIAN ANALYSIS
+# ================================================================
+
+FAR_ARM_USERS = [1_000_000, 1_000_000, 1_000_000]
+FAR_ARM_CONVERSIONS = [1000, 1100, 500_000]
+
+def test_bayesian_far_arm_does_not_break_quadrature():
+    """An arm far from the others must not starve the narrow posteriors of grid points"""
+    posterior = ab_stats.bayesian_compare(FAR_ARM_USERS, FAR_ARM_CONVERSIONS)
+    beat = posterior['probability_to_beat_control']
+    assert beat[0] == pytest.approx(0.9855, abs=1e-3)
+    assert beat[1] == pytest.approx(1.0)
+    assert posterior['probability_to_be_best'] == pytest.approx([0.0, 0.0, 1.0], abs=1e-9)
+
+def test_bayesian_far_arm_matches_two_arm_result():
+    """The control/variant comparison does not depend on which other arms are present"""
+    three_arms = ab_stats.bayesian_compare(FAR_ARM_USERS, FAR_ARM_CONVERSIONS)
+    two_arms = ab_stats.bayesian_compare(FAR_ARM_USERS[:2], FAR_ARM_CONVERSIONS[:2])
+    assert three_arms['probability_to_beat_control'][0] == pytest.approx(two_arms['probability_to_beat_control'][0], abs=1e-9)
+    assert three_arms['expected_loss_control'][0] == pytest.approx(two_arms['expected_loss_control'][0], abs=1e-12)
+
+def test_bayesian_monte_carlo_takes_beat_control_from_draws():
+    """With samples > 0 every probability comes from the draw matrix"""
+    first = ab_stats.bayesian_compare(FAR_ARM_USERS, FAR_ARM_CONVERSIONS, samples=200_000, seed=11)
+    again = ab_stats.bayesian_compare(FAR_ARM_USERS, FAR_ARM_CONVERSIONS, samples=200_000, seed=11)
+    other_seed = ab_stats.bayesian_compare(FAR_ARM_USERS, FAR_ARM_CONVERSIONS, samples=200_000, seed=12)
+    assert first['probability_to_beat_control'][0] == pytest.approx(0.9855, abs=2e-3)
+    assert np.array_equal(first['probability_to_beat_control'], again['probability_to_beat_control'])
+    assert first['probability_to_beat_control'][0] != other_seed['probability_to_beat_control'][0]
+
+@pytest.mark.parametrize('users, conversions', [
+    ([1000, 1000], [100, 120]),
+    ([50, 60, 70], [5, 9, 3]),
+    ([10, 10], [0, 1])
+])
+def test_bayesian_quadrature_agrees_with_monte_carlo(users, conversions):
+    exact = ab_stats.bayesian_compare(users, conversions)
+    sampled = ab_stats.bayesian_compare(users, conversions, samples=400_000, seed=3)
+    for key in ('probability_to_beat_control', 'probability_to_be_best'):
+        assert exact[key] == pytest.approx(sampled[key], abs=5e-3)
+    for key in ('expected_loss_variant', 'expected_loss_control'):
+        assert exact[key] == pytest.approx(sampled[key], abs=5e-4)
+
+def test_bayesian_two_arm_reference_values():
+    # Beta(101, 901) vs Beta(121, 881): P(V > C) by direct numerical integration
+    from scipy import integrate, stats
+    control, variant = stats.beta(101, 901), stats.beta(121, 881)
+    reference, _ = integrate.quad(lambda x: control.pdf(x) * variant.sf(x), 0, 1, points=[0.1, 0.12], limit=200)
+    posterior = ab_stats.bayesian_compare([1000, 1000], [100, 120])
+    assert posterior['probability_to_beat_control'][0] == pytest.approx(reference, abs=1e-6)
+    assert posterior['probability_to_be_best'].sum() == pytest.approx(1.0, abs=1e-6)
+    assert posterior['posterior_mean'] == pytest.approx([101 / 1002, 121 / 1002])
+
+# ================================================================
+# POWER GRID
+# ================================================================
+
+@pytest.mark.parametrize('arms', [2, 3, 4, 5])
+def test_power_grid_serves_bonferroni_adjusted_alpha(arms):
+    grid = ab_stats.PowerGrid()
+    alpha = 0.05 / (arms - 1)
+    exact = ab_stats.required_sample_size(0.05, 0.1, alpha, 0.8)
+    assert grid.sample_size(0.05, 0.1, alpha, 0.8) == pytest.approx(exact, rel=1e-3)
+
+def test_power_grid_keeps_untabulated_alpha_off_grid():
+    assert ab_stats.PowerGrid().sample_size(0.05, 0.1, 0.0033, 0.8) is None
@@ -0,0 +1,152 @@
+# ================================================================
+# TRUST ENGINE - AI CLIENT TESTS
+# ================================================================
+# Deadline, queue and circuit breaker behaviour against a stub model,
+# so no Gemini key or network access is needed.
+# ================================================================
+
+import threading
+import time
+
+import pytest
+
+from app import AIClient, CircuitBreaker
+
+class UpstreamError(Exception):
+    """Stand-in for an SDK error carrying an HTTP status"""
+
+    def __init__(self, code):
+        super().__init__(f'upstream returned {code}')
+        self.code = code
+
+class StubReply:
+    def __init__(self, text):
+        self.text = text
+
+class StubModel:
+    """generate_content that returns a fixed text, raises, or blocks until released"""
+
+    def __init__(self, text='{"ok": true}'):
+        self.text = text
+        self.error = None
+        self.release = threading.Event()
+        self.release.set()
+        self.calls = 0
+
+    def generate_content(self, prompt):
+        self.calls += 1
+        self.release.wait(5)
+        if self.error is not None:
+            raise self.error
+        return StubReply(self.text)
+
+def _settle(breaker, outcomes):
+    # Outcomes are reported from the future's done callback, just after the caller wakes
+    deadline = time.monotonic() + 2
+    while time.monotonic() < deadline:
+        snapshot = breaker.snapshot()
+        if snapshot['total_failures'] + snapshot['total_successes'] >= outcomes:
+            return snapshot
+        time.sleep(0.005)
+    raise AssertionError('breaker outcome was never recorded')
+
+def _client(model, **options):
+    breaker = CircuitBreaker(failure_threshold=options.pop('failure_threshold', 2), recovery_timeout=options.pop('recovery_timeout', 0.05))
+    return AIClient(model=model, breaker=breaker, **options)
+
+# ================================================================
+# DEADLINE AND QUEUE
+# ================================================================
+
+def test_reply_is_parsed_and_counted_as_success():
+    client = _client(StubModel())
+    assert client.generate_json('prompt') == {'ok': True}
+    assert _settle(client.breaker, 1)['state'] == CircuitBreaker.CLOSED
+
+def test_deadline_raises_timeout_and_counts_as_failure():
+    model = StubModel()
+    model.release.clear()
+    client = _client(model, timeout=0.05)
+    try:
+        with pytest.raises(TimeoutError):
+            client.generate_json('slow prompt')
+        snapshot = client.breaker.snapshot()
+        assert snapshot['consecutive_failures'] == 1
+        assert snapshot['last_failure'].startswith('TimeoutError')
+    finally:
+        model.release.set()
+
+def test_full_queue_is_rejected_without_touching_the_breaker():
+    model = StubModel()
+    model.release.clear()
+    client = _client(model, max_workers=1, max_queued=0)
+    blocked = threading.Thread(target=lambda: client.generate_json('first', timeout=2))
+    blocked.start()
+    try:
+        deadline = time.monotonic() + 2
+        while model.calls == 0 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        with pytest.raises(RuntimeError, match='queue is full'):
+            client.generate_json('second')
+        snapshot = client.breaker.snapshot()
+        assert snapshot['total_failures'] == 0 and snapshot['state'] == CircuitBreaker.CLOSED
+    finally:
+        model.release.set()
+        blocked.join()
+
+# ================================================================
+# CIRCUIT BREAKER
+# ================================================================
+
+def test_breaker_opens_then_recovers_through_a_half_open_probe():
+    model = StubModel()
+    model.error = UpstreamError(503)
+    client = _client(model, failure_threshold=2, recovery_timeout=0.05)
+
+    for outcomes in (1, 2):
+        with pytest.raises(UpstreamError):
+            client.generate_json(f'prompt {outcomes}')
+        _settle(client.breaker, outcomes)
+    assert client.breaker.snapshot()['state'] == CircuitBreaker.OPEN
+    assert client.status == 'degraded'
+
+    # Open: callers fail fast and the model is not called
+    with pytest.raises(RuntimeError, match='circuit breaker is open'):
+        client.generate_json('prompt 3')
+    assert model.calls == 2
+
+    # After the recovery timeout one probe goes through; its failure re-opens the circuit
+    time.sleep(0.06)
+    with pytest.raises(UpstreamError):
+        client.generate_json('probe 1')
+    assert _settle(client.breaker, 3)['state'] == CircuitBreaker.OPEN
+
+    # A successful probe closes it again
+    time.sleep(0.06)
+    model.error = None
+    assert client.generate_json('probe 2') == {'ok': True}
+    snapshot = _settle(client.breaker, 4)
+    assert snapshot['state'] == CircuitBreaker.CLOSED and snapshot['consecutive_failures'] == 0
+    assert client.status == 'healthy'
+
+def test_half_open_admits_a_single_probe():
+    breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=0.0)
+    breaker.record_failure(UpstreamError(500))
+    assert breaker.allow_request()
+    assert breaker.snapshot()['state'] == CircuitBreaker.HALF_OPEN
+    assert not breaker.allow_request()
+    breaker.release_probe()
+    assert breaker.allow_request()
+
+@pytest.mark.parametrize('model_text, error', [
+    ('not json at all', None),
+    (None, UpstreamError(400))
+])
+def test_unusable_replies_do_not_open_the_breaker(model_text, error):
+    model = StubModel(text=model_text)
+    model.error = error
+    client = _client(model, failure_threshold=1)
+    with pytest.raises((ValueError, UpstreamError)):
+        client.generate_json('prompt')
+    snapshot = _settle(client.breaker, 1)
+    assert snapshot['state'] == CircuitBreaker.CLOSED and snapshot['total_failures'] == 0
@@ -0,0 +1,56 @@
+# ================================================================
+# TRUST ENGINE - BACKGROUND JOB LEASE TESTS
+# ================================================================
+
+import time
+
+import pytest
+
+import app
+import campaign_store
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    db = campaign_store.CampaignStore(str(tmp_path / 'jobs.sqlite3'))
+    monkeypatch.setattr(app, 'campaign_db', db)
+    return db
+
+def _job(tmp_path, status='running', lease_in=60.0):
+    return {
+        'job_id': f'job-{status}-{lease_in}', 'status': status, 'path': str(tmp_path / 'out.pdf'),
+        'owner': 'boot:1', 'lease_expires_at': time.time() + lease_in, 'error': None
+    }
+
+def test_job_with_a_live_lease_is_left_alone(store, tmp_path):
+    job = store.put_job('report', _job(tmp_path))
+    assert app._settle_orphaned_job('report', job, {})['status'] == 'running'
+
+def test_lapsed_lease_without_output_fails_the_job(store, tmp_path):
+    job = store.put_job('report', _job(tmp_path, lease_in=-1))
+    settled = app._settle_orphaned_job('report', job, {})
+    assert settled['status'] == 'failed' and settled['error']
+    assert store.get_job('report', job['job_id'])['status'] == 'failed'
+
+def test_lapsed_lease_with_finished_output_completes_the_job(store, tmp_path):
+    job = store.put_job('export', _job(tmp_path, status='queued', lease_in=-1))
+    (tmp_path / 'out.pdf').write_bytes(b'x' * 10)
+    settled = app._settle_orphaned_job('export', job, {'rows': 3})
+    assert (settled['status'], settled['size_bytes'], settled['rows']) == ('completed', 10, 3)
+
+def test_renewal_skips_finished_jobs(store, tmp_path):
+    running = store.put_job('report', _job(tmp_path, lease_in=-1))
+    done = store.put_job('report', _job(tmp_path, status='completed', lease_in=-1))
+    store.renew_job_leases([running['job_id'], done['job_id']], time.time() + 60)
+    assert not app.JobLeases.expired(store.get_job('report', running['job_id']))
+    assert store.get_job('report', done['job_id'])['lease_expires_at'] < time.time()
+
+def test_heartbeat_keeps_acquired_leases_fresh_until_released(store, tmp_path):
+    leases = app.JobLeases(lease_seconds=0.3)
+    job = {**_job(tmp_path), **leases.acquire('job-heartbeat'), 'job_id': 'job-heartbeat'}
+    store.put_job('report', job)
+    time.sleep(0.45)
+    renewed = store.get_job('report', 'job-heartbeat')
+    assert renewed['lease_expires_at'] > job['lease_expires_at']
+    leases.release('job-heartbeat')
+    time.sleep(0.45)
+    assert app.JobLeases.expired(store.get_job('report', 'job-heartbeat'))
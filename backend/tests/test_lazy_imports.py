@@ -0,0 +1,32 @@
+# ================================================================
+# TRUST ENGINE - DEFERRED IMPORT TESTS
+# ================================================================
+
+import sys
+
+import pytest
+
+import lazy_imports
+
+def test_max_rss_is_none_without_the_resource_module(monkeypatch):
+    monkeypatch.setitem(sys.modules, 'resource', None)  # import now raises ImportError, as on Windows
+    report = lazy_imports.StartupReport()
+    report.finish()
+    assert report.to_dict()['max_rss_mb'] is None
+
+@pytest.mark.parametrize('platform, ru_maxrss, expected', [
+    ('linux', 512 * 1024, 512.0),              # kilobytes
+    ('darwin', 512 * 1024 * 1024, 512.0)       # bytes
+])
+def test_max_rss_is_scaled_per_platform(monkeypatch, platform, ru_maxrss, expected):
+    resource = pytest.importorskip('resource')
+    monkeypatch.setattr(sys, 'platform', platform)
+    monkeypatch.setattr(resource, 'getrusage', lambda who: type('Usage', (), {'ru_maxrss': ru_maxrss})())
+    assert lazy_imports.max_rss_mb() == expected
+
+def test_lazy_module_imports_on_first_attribute_access():
+    report = lazy_imports.StartupReport()
+    module = lazy_imports.LazyModule('colorsys', report)
+    assert not module.loaded
+    assert module.rgb_to_hsv(1, 0, 0)[0] == 0
+    assert module.loaded
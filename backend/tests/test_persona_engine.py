@@ -0,0 +1,40 @@
+# ================================================================
+# TRUST ENGINE - PERSONA COLUMNAR EXPORT TESTS
+# ================================================================
+
+import io
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pytest
+
+import persona_engine
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+def _read(sink, file_format):
+    sink.seek(0)
+    return pa.ipc.open_file(sink).read_all() if file_format == 'arrow' else pq.read_table(sink)
+
+def test_export_schema_matches_generated_batches():
+    batch = persona_engine.generate_batch(np.random.default_rng(1), 0, 25)
+    assert persona_engine.batch_to_arrow(batch, 'test').schema.equals(persona_engine.export_schema())
+
+@pytest.mark.parametrize('file_format', persona_engine.COLUMNAR_FORMATS)
+def test_zero_batches_still_write_the_schema(file_format):
+    sink = io.BytesIO()
+    rows = persona_engine.write_columnar([], sink, file_format, 'test', {'count': 0})
+    table = _read(sink, file_format)
+    assert rows == 0 and table.num_rows == 0
+    assert table.column_names == list(persona_engine.EXPORT_COLUMNS)
+    assert table.schema.metadata[b'count'] == b'0'
+
+def test_concurrent_batches_share_one_dictionary_per_vocabulary():
+    persona_engine._arrow_dictionaries.clear()
+    batches = [persona_engine.generate_batch(np.random.default_rng(seed), 0, 10) for seed in range(16)]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        record_batches = list(pool.map(lambda batch: persona_engine.batch_to_arrow(batch, 'test'), batches))
+    # Same underlying buffer, not just equal values
+    addresses = {record_batch.column('education').dictionary.buffers()[2].address for record_batch in record_batches}
+    assert len(addresses) == 1
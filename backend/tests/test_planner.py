@@ -0,0 +1,38 @@
+# ================================================================
+# TRUST ENGINE - A/B TEST PLANNER ENDPOINT TESTS
+# ================================================================
+
+import pytest
+
+from app import app
+
+PLAN = {'baseline_rate': 0.05, 'mde': 0.1, 'daily_traffic': 5000}
+
+@pytest.fixture
+def client():
+    return app.test_client()
+
+@pytest.mark.parametrize('field, value', [
+    ('daily_traffic', -100),
+    ('test_duration', 0),
+    ('baseline_rate', 0),
+    ('baseline_rate', 1),
+    ('alpha', 0),
+    ('alpha', 1),
+    ('power', 0),
+    ('power', 1),
+    ('arms', 1),
+    ('mde', 0)
+])
+def test_out_of_range_inputs_are_rejected(client, field, value):
+    response = client.get('/api/ab-test/plan', query_string={**PLAN, field: value})
+    assert response.status_code == 400
+    assert [error['loc'] for error in response.get_json()['details']] == [[field]]
+
+@pytest.mark.parametrize('arms', [2, 3, 5])
+def test_multi_arm_plans_use_the_grid(client, arms):
+    response = client.get('/api/ab-test/plan', query_string={**PLAN, 'arms': arms})
+    plan = response.get_json()
+    assert response.status_code == 200
+    assert plan['method'] == 'grid_interpolation'
+    assert plan['adjusted_alpha'] == pytest.approx(0.05 / (arms - 1), abs=1e-6)
@@ -0,0 +1,21 @@
+# ================================================================
+# TRUST ENGINE - PDF REPORT ENGINE TESTS
+# ================================================================
+
+import pytest
+
+pytest.importorskip('reportlab')
+
+import report_engine
+
+def _campaign(**scores):
+    return {'campaign_id': 'c1', 'name': 'Spring', 'variant': 'A', 'ctr': 2.5, **scores}
+
+@pytest.mark.parametrize('field', ['compliance_score', 'trust_score'])
+def test_zero_score_is_flagged(field):
+    recommendations = report_engine.report_recommendations([_campaign(**{field: 0})], [], [])
+    assert any(f"{field.replace('_', ' ')} 0 is below" in line for line in recommendations)
+
+def test_missing_scores_are_not_flagged():
+    recommendations = report_engine.report_recommendations([_campaign(compliance_score=None)], [], [])
+    assert not any('score' in line for line in recommendations)
@@ -0,0 +1,36 @@
+# ================================================================
+# TRUST ENGINE - BIAS TERM MATCHER TESTS
+# ================================================================
+
+import pytest
+
+from app import TermMatcher
+
+LEXICON = {
+    'age': ['young', 'senior', 'young and energetic'],
+    'accessibility': ['see', 'walk'],
+    'gender': ['guys']
+}
+
+def test_scan_reports_whole_words_with_offsets():
+    hits = TermMatcher(LEXICON).scan('Young guys see. Seniority and seesaw do not count')
+    assert hits == {'age': [('young', 0, 5)], 'gender': [('guys', 6, 10)], 'accessibility': [('see', 11, 14)]}
+
+def test_scan_prefers_the_longest_phrase():
+    hits = TermMatcher(LEXICON).scan('We want young and energetic people, young at heart')
+    assert hits['age'] == [('young and energetic', 8, 27), ('young', 36, 41)]
+
+@pytest.mark.parametrize('text, term', [
+    ('ſee the demo', 'see'),       # long s folds to s
+    ('SEE THE DEMO', 'see'),
+    ('Walk in', 'walk'),
+    ('WALK in', 'walk'),
+    ('wal\u212a in', 'walk')  # Kelvin sign folds to k
+])
+def test_case_folded_matches_map_back_to_the_lexicon_term(text, term):
+    hits = TermMatcher(LEXICON).scan(text)
+    assert hits['accessibility'][0][0] == term
+
+def test_term_in_several_categories_is_reported_for_each():
+    hits = TermMatcher({'a': ['young'], 'b': ['Young']}).scan('young')
+    assert hits == {'a': [('young', 0, 5)], 'b': [('young', 0, 5)]}
@@ -19,7 +19,8 @@ export const ENDPOINTS = {
   BIAS_ANALYSIS: '/bias-analysis',
   AB_TEST_SIMULATION: '/ab-test-simulation',
   PERSONA_GENERATION: '/generate-personas',
-  CAMPAIGN_ANALYTICS: '/campaign-analytics'
+  CAMPAIGN_ANALYTICS: '/campaign-analytics',
+  AB_TEST_PLAN: '/ab-test/plan'
 }
 
 export default API_CONFIG
@@ -54,6 +54,7 @@ export const apiService = {
   
   // A/B testing
   runAbTestSimulation: (data) => api.post(ENDPOINTS.AB_TEST_SIMULATION, data),
+  planAbTest: (params) => api.get(ENDPOINTS.AB_TEST_PLAN, { params }),
   
   // Persona generation
   generatePersonas: (config) => api.post(ENDPOINTS.PERSONA_GENERATION, config),